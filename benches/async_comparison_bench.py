@@ -20,6 +20,12 @@ except ImportError:
     subprocess.run([sys.executable, "-m", "pip", "install", "aiohttp", "requests", "-q"])
     import aiohttp
     import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import uvloop  # optional: faster event loop for the aiohttp client
+except ImportError:
+    uvloop = None
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -76,32 +82,44 @@ def create_turboapi_app():
     return app
 
 
+def latency_stats(times: list[float]) -> dict:
+    """Mean/median/percentiles/min/max (ms) from a single sort of the samples"""
+    ordered = sorted(times)
+    n = len(ordered)
+    mid = n // 2
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "median_ms": ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2,
+        "p95_ms": ordered[int(0.95 * n)],
+        "p99_ms": ordered[int(0.99 * n)],
+        "min_ms": ordered[0],
+        "max_ms": ordered[-1],
+    }
+
+
 def benchmark_sequential(url: str, iterations: int = 100) -> dict:
-    """Sequential request benchmark"""
+    """Sequential request benchmark (one keep-alive connection for all requests)"""
     times = []
     errors = 0
+    http = requests.Session()
 
     for _ in range(iterations):
         start = time.perf_counter()
         try:
-            resp = requests.get(url, timeout=5)
+            resp = http.get(url, timeout=5)
             if resp.status_code == 200:
                 times.append((time.perf_counter() - start) * 1000)
             else:
                 errors += 1
         except:
             errors += 1
+    http.close()
 
     if not times:
         return {"error": "All requests failed"}
 
     return {
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "p95_ms": sorted(times)[int(0.95 * len(times))],
-        "p99_ms": sorted(times)[int(0.99 * len(times))],
-        "min_ms": min(times),
-        "max_ms": max(times),
+        **latency_stats(times),
         "errors": errors,
         "samples": len(times)
     }
@@ -112,12 +130,16 @@ def benchmark_concurrent(url: str, concurrency: int, total_requests: int) -> dic
     times = []
     errors = 0
     lock = threading.Lock()
+    # Shared so worker threads reuse pooled connections; the default adapter
+    # keeps only 10, which would force reconnects above that concurrency
+    http = requests.Session()
+    http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=concurrency))
 
     def make_request():
         nonlocal errors
         start = time.perf_counter()
         try:
-            resp = requests.get(url, timeout=10)
+            resp = http.get(url, timeout=10)
             duration = (time.perf_counter() - start) * 1000
             if resp.status_code == 200:
                 with lock:
@@ -137,15 +159,13 @@ def benchmark_concurrent(url: str, concurrency: int, total_requests: int) -> dic
             pass
 
     overall_duration = time.perf_counter() - overall_start
+    http.close()
 
     if not times:
         return {"error": "All requests failed"}
 
     return {
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "p95_ms": sorted(times)[int(0.95 * len(times))],
-        "p99_ms": sorted(times)[int(0.99 * len(times))],
+        **latency_stats(times),
         "throughput_rps": len(times) / overall_duration,
         "errors": errors,
         "samples": len(times),
@@ -153,19 +173,23 @@ def benchmark_concurrent(url: str, concurrency: int, total_requests: int) -> dic
     }
 
 
-async def benchmark_async_client(url: str, concurrency: int, total_requests: int) -> dict:
-    """Async benchmark using aiohttp for true async client"""
+async def benchmark_async_client(
+    session: aiohttp.ClientSession, url: str, concurrency: int, total_requests: int
+) -> dict:
+    """Async benchmark using aiohttp for true async client
+
+    The session (and its warm connection pool) is shared across runs, so
+    concurrency is capped per run with a semaphore rather than the connector.
+    """
     times = []
     errors = 0
-
-    connector = aiohttp.TCPConnector(limit=concurrency)
-    timeout = aiohttp.ClientTimeout(total=10)
+    sem = asyncio.Semaphore(concurrency)
 
     overall_start = time.perf_counter()
 
-    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-        async def fetch():
-            nonlocal errors
+    async def fetch():
+        nonlocal errors
+        async with sem:
             start = time.perf_counter()
             try:
                 async with session.get(url) as resp:
@@ -177,8 +201,8 @@ async def benchmark_async_client(url: str, concurrency: int, total_requests: int
             except:
                 errors += 1
 
-        tasks = [asyncio.create_task(fetch()) for _ in range(total_requests)]
-        await asyncio.gather(*tasks)
+    tasks = [asyncio.create_task(fetch()) for _ in range(total_requests)]
+    await asyncio.gather(*tasks)
 
     overall_duration = time.perf_counter() - overall_start
 
@@ -186,10 +210,7 @@ async def benchmark_async_client(url: str, concurrency: int, total_requests: int
         return {"error": "All requests failed"}
 
     return {
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "p95_ms": sorted(times)[int(0.95 * len(times))],
-        "p99_ms": sorted(times)[int(0.99 * len(times))],
+        **latency_stats(times),
         "throughput_rps": len(times) / overall_duration,
         "errors": errors,
         "samples": len(times),
@@ -285,18 +306,29 @@ def run_async_benchmarks():
     print(" PART 3: True Async Client (aiohttp)")
     print("-" * 70)
 
+    aiohttp_concurrency_levels = [50, 100, 200, 500]
+
     async def run_aiohttp_benchmarks():
+        # Size the pool for the largest run so connections are never queued in
+        # the connector; the per-run semaphores decide the actual concurrency.
+        peak = max(aiohttp_concurrency_levels)
+        connector = aiohttp.TCPConnector(limit=peak, limit_per_host=peak, keepalive_timeout=75)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            await _run_aiohttp_benchmarks(session)
+
+    async def _run_aiohttp_benchmarks(session):
         for sync_ep, async_ep, name in [("/sync/simple", "/async/simple", "Simple Return")]:
             print(f"\n{name} with aiohttp client:")
 
-            for concurrency in [50, 100, 200, 500]:
+            for concurrency in aiohttp_concurrency_levels:
                 total = concurrency * 10
 
                 sync_results = await benchmark_async_client(
-                    f"{base_url}{sync_ep}", concurrency, total
+                    session, f"{base_url}{sync_ep}", concurrency, total
                 )
                 async_results = await benchmark_async_client(
-                    f"{base_url}{async_ep}", concurrency, total
+                    session, f"{base_url}{async_ep}", concurrency, total
                 )
 
                 if "throughput_rps" in sync_results and "throughput_rps" in async_results:
@@ -304,7 +336,9 @@ def run_async_benchmarks():
                     print(f"    Sync handler:  {sync_results['mean_ms']:.2f}ms, {sync_results['throughput_rps']:.0f} RPS")
                     print(f"    Async handler: {async_results['mean_ms']:.2f}ms, {async_results['throughput_rps']:.0f} RPS")
 
-    asyncio.run(run_aiohttp_benchmarks())
+    loop_factory = uvloop.new_event_loop if uvloop is not None and sys.platform != "win32" else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_aiohttp_benchmarks())
 
     print("\n" + "=" * 70)
     print(" BENCHMARK SUMMARY")
@@ -29,6 +29,12 @@ except ImportError:
     import subprocess
     subprocess.run([sys.executable, "-m", "pip", "install", "requests", "-q"])
     import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional: pip install turboapi[orjson]
 
 from turboapi import TurboAPI
 
@@ -118,6 +124,20 @@ def benchmark_json_serialization():
         times.append((time.perf_counter() - start) * 1000)
     results.add("JSON Serialize (large - 100 users)", times, "ms")
 
+    # orjson (C encoder, returns bytes) on the same payloads for comparison
+    if orjson is not None:
+        for label, payload, count in [
+            ("small - 3 keys", small, iterations),
+            ("medium - 50 items", medium, iterations),
+            ("large - 100 users", large, iterations // 10),
+        ]:
+            times = []
+            for _ in range(count):
+                start = time.perf_counter()
+                orjson.dumps(payload)
+                times.append((time.perf_counter() - start) * 1000)
+            results.add(f"orjson Serialize ({label})", times, "ms")
+
     return results
 
 
@@ -275,17 +295,22 @@ def benchmark_live_server():
     base_url = f"http://127.0.0.1:{port}"
     iterations = 500
     warmup = 50
+    # One session keeps connections alive, so timings measure the server rather
+    # than a TCP handshake per request
+    http = requests.Session()
+    # Pool sized for the largest concurrent batch below (default keeps only 10)
+    http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=100))
 
     try:
         # Warmup
         for _ in range(warmup):
-            requests.get(f"{base_url}/sync", timeout=5)
+            http.get(f"{base_url}/sync", timeout=5)
 
         # Sync endpoint
         times = []
         for _ in range(iterations):
             start = time.perf_counter()
-            resp = requests.get(f"{base_url}/sync", timeout=5)
+            resp = http.get(f"{base_url}/sync", timeout=5)
             times.append((time.perf_counter() - start) * 1000)
         results.add("HTTP GET /sync", times, "ms")
 
@@ -293,7 +318,7 @@ def benchmark_live_server():
         times = []
         for _ in range(iterations):
             start = time.perf_counter()
-            resp = requests.get(f"{base_url}/async", timeout=5)
+            resp = http.get(f"{base_url}/async", timeout=5)
             times.append((time.perf_counter() - start) * 1000)
         results.add("HTTP GET /async", times, "ms")
 
@@ -302,20 +327,23 @@ def benchmark_live_server():
             times = []
             for _ in range(iterations // 5):
                 start = time.perf_counter()
-                resp = requests.get(f"{base_url}{endpoint}", timeout=5)
+                resp = http.get(f"{base_url}{endpoint}", timeout=5)
                 times.append((time.perf_counter() - start) * 1000)
             results.add(f"HTTP GET {endpoint}", times, "ms")
 
         # Concurrent requests
-        for concurrency in [10, 50, 100]:
-            def make_request():
-                start = time.perf_counter()
-                requests.get(f"{base_url}/sync", timeout=5)
-                return (time.perf_counter() - start) * 1000
+        def make_request():
+            start = time.perf_counter()
+            http.get(f"{base_url}/sync", timeout=5)
+            return (time.perf_counter() - start) * 1000
 
-            times = []
-            for _ in range(10):  # 10 batches
-                with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for concurrency in [10, 50, 100]:
+            # One pool per level, reused across batches, so worker thread
+            # start-up is not counted in the batch timings
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+                concurrent.futures.wait([executor.submit(make_request) for _ in range(concurrency)])
+                times = []
+                for _ in range(10):  # 10 batches
                     batch_start = time.perf_counter()
                     futures = [executor.submit(make_request) for _ in range(concurrency)]
                     concurrent.futures.wait(futures)
@@ -325,6 +353,8 @@ def benchmark_live_server():
 
     except Exception as e:
         print(f"Error during live server benchmark: {e}")
+    finally:
+        http.close()
 
     return results
 
@@ -8,6 +8,8 @@ import asyncio
 from collections.abc import Coroutine
 from typing import Any
 
+from .exceptions import HTTPException
+
 
 class AsyncLimiter:
     """Semaphore-based limiter for async tasks
@@ -17,16 +19,29 @@ class AsyncLimiter:
 
     Args:
         max_concurrent: Maximum number of concurrent tasks (default: 512)
+        max_waiting: Maximum number of tasks allowed to queue for a slot. Once
+            reached, new tasks are rejected with a 503 instead of piling up
+            (default: None, unbounded)
+        max_wait: Seconds a task may wait for a slot before it is rejected with
+            a 503, so callers are not served stale work (default: None, no limit)
 
     Example:
-        limiter = AsyncLimiter(max_concurrent=512)
+        limiter = AsyncLimiter(max_concurrent=512, max_waiting=1024, max_wait=5.0)
         result = await limiter(some_coroutine())
     """
 
-    def __init__(self, max_concurrent: int = 512):
+    def __init__(
+        self,
+        max_concurrent: int = 512,
+        max_waiting: int | None = None,
+        max_wait: float | None = None,
+    ):
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.max_wait = max_wait
         self._active_tasks = 0
+        self._waiting_tasks = 0
 
     async def __call__(self, coro: Coroutine) -> Any:
         """Execute coroutine with semaphore gating
@@ -36,19 +51,58 @@ class AsyncLimiter:
 
         Returns:
             Result of the coroutine
+
+        Raises:
+            HTTPException: 503 if all slots are busy and the wait queue is full,
+                or no slot freed up within max_wait seconds
         """
-        async with self.semaphore:
-            self._active_tasks += 1
-            try:
-                return await coro
-            finally:
-                self._active_tasks -= 1
+        if (
+            self.max_waiting is not None
+            and self.semaphore.locked()
+            and self._waiting_tasks >= self.max_waiting
+        ):
+            raise self._reject(coro)
+
+        self._waiting_tasks += 1
+        try:
+            if self.max_wait is None:
+                await self.semaphore.acquire()
+            else:
+                await asyncio.wait_for(self.semaphore.acquire(), self.max_wait)
+        except TimeoutError:
+            raise self._reject(coro) from None
+        except asyncio.CancelledError:
+            coro.close()  # cancelled while queued; it will never run
+            raise
+        finally:
+            self._waiting_tasks -= 1
+
+        self._active_tasks += 1
+        try:
+            return await coro
+        finally:
+            self._active_tasks -= 1
+            self.semaphore.release()
+
+    @staticmethod
+    def _reject(coro: Coroutine) -> HTTPException:
+        coro.close()  # never awaited; avoid the "was never awaited" warning
+        return HTTPException(
+            status_code=503,
+            detail="Server overloaded, retry later",
+            headers={"Retry-After": "1"},
+        )
 
     @property
     def active_tasks(self) -> int:
         """Get current number of active tasks"""
         return self._active_tasks
 
+    @property
+    def waiting_tasks(self) -> int:
+        """Get number of tasks queued for a slot"""
+        return self._waiting_tasks
+
     @property
     def available_slots(self) -> int:
         """Get number of available slots"""
@@ -59,11 +113,15 @@ class AsyncLimiter:
 _limiters = {}
 
 
-def get_limiter(max_concurrent: int = 512) -> AsyncLimiter:
+def get_limiter(
+    max_concurrent: int = 512, max_waiting: int | None = None, max_wait: float | None = None
+) -> AsyncLimiter:
     """Get or create limiter for current event loop
 
     Args:
         max_concurrent: Maximum concurrent tasks
+        max_waiting: Maximum tasks queued for a slot before rejecting with 503
+        max_wait: Seconds a task may wait for a slot before rejecting with 503
 
     Returns:
         AsyncLimiter instance for current event loop
@@ -73,12 +131,12 @@ def get_limiter(max_concurrent: int = 512) -> AsyncLimiter:
         loop_id = id(loop)
 
         if loop_id not in _limiters:
-            _limiters[loop_id] = AsyncLimiter(max_concurrent)
+            _limiters[loop_id] = AsyncLimiter(max_concurrent, max_waiting, max_wait)
 
         return _limiters[loop_id]
     except RuntimeError:
         # No running loop, create standalone limiter
-        return AsyncLimiter(max_concurrent)
+        return AsyncLimiter(max_concurrent, max_waiting, max_wait)
 
 
 def reset_limiters():
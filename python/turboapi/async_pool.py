@@ -7,6 +7,7 @@ parallel execution of async handlers across multiple threads.
 
 import asyncio
 import json
+import os
 import sys
 import threading
 
@@ -17,6 +18,23 @@ _dumps = json.dumps
 _thread_local = threading.local()
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a worker loop, using uvloop when it is installed (TURBO_DISABLE_UVLOOP=1 opts out).
+
+    uvloop is imported on first use rather than at module load. On free-threaded
+    builds it is only used when TURBO_UVLOOP=1 asks for it explicitly.
+    """
+    if os.getenv("TURBO_DISABLE_UVLOOP") != "1":
+        if not is_free_threading_enabled() or os.getenv("TURBO_UVLOOP") == "1":
+            try:
+                import uvloop
+            except ImportError:  # optional: pip install turboapi[uvloop]
+                pass
+            else:
+                return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
 def _set_thread_loop(loop: asyncio.AbstractEventLoop) -> asyncio.AbstractEventLoop:
     _thread_local.loop = loop
     _thread_local.run_until_complete = loop.run_until_complete
@@ -52,8 +70,6 @@ class EventLoopPool:
                 return
 
             if num_threads is None:
-                import os
-
                 num_threads = os.cpu_count() or 4
 
             cls._initialized = True
@@ -68,23 +84,20 @@ class EventLoopPool:
         """
         thread_id = threading.get_ident()
 
-        # Fast path: loop already exists
-        if thread_id in cls._loops:
-            loop = cls._loops[thread_id]
+        # Fast path: loop already exists (thread ids are recycled, so skip a
+        # closed loop left behind by a finished thread)
+        loop = cls._loops.get(thread_id)
+        if loop is not None and not loop.is_closed():
             return _set_thread_loop(loop)
 
-        # Slow path: create new loop
+        # Slow path: create the loop outside the lock. Only this thread ever
+        # registers its own thread_id, so the lock just guards the dict insert
+        # against concurrent iteration in cleanup()/stats().
+        loop = _new_event_loop()
+        asyncio.set_event_loop(loop)
         with cls._lock:
-            # Double-check after acquiring lock
-            if thread_id in cls._loops:
-                loop = cls._loops[thread_id]
-                return _set_thread_loop(loop)
-
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             cls._loops[thread_id] = loop
-            return _set_thread_loop(loop)
+        return _set_thread_loop(loop)
 
     @classmethod
     def get_running_loop(cls) -> asyncio.AbstractEventLoop | None:
@@ -2,10 +2,14 @@
 JSON encoding utilities (FastAPI-compatible).
 
 This module provides the jsonable_encoder function for converting
-objects to JSON-serializable dictionaries.
+objects to JSON-serializable dictionaries, and the JSON body decoder
+shared by the request paths.
 """
 
 import dataclasses
+import json
+import re
+import sys
 from collections import deque
 from collections.abc import Callable
 from datetime import date, datetime, time, timedelta
@@ -15,6 +19,11 @@ from pathlib import Path, PurePath
 from typing import Any
 from uuid import UUID
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import dhi BaseModel
 try:
     from dhi import BaseModel
@@ -24,13 +33,33 @@ except ImportError:
     BaseModel = None
     HAS_DHI = False
 
-# Try to import Pydantic for compatibility
-try:
-    import pydantic
 
-    HAS_PYDANTIC = True
-except ImportError:
-    HAS_PYDANTIC = False
+# Pydantic is supported but never imported here: an object can only be a
+# pydantic model once the application has imported pydantic itself, so the
+# class is looked up in sys.modules when needed instead of paying its import
+# cost at startup.
+def _pydantic_base_model() -> type | None:
+    """Return pydantic.BaseModel if pydantic is already loaded, else None."""
+    return getattr(sys.modules.get("pydantic"), "BaseModel", None)
+
+
+# orjson turns integers outside the 64-bit range into floats; any 19+ digit run
+# might be one, so such bodies go to the stdlib, which keeps them exact.
+_LONG_DIGITS = re.compile(rb"\d{19,}")
+_LONG_DIGITS_STR = re.compile(r"\d{19,}")
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Decode a JSON request body, using orjson when it is installed and lossless."""
+    long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS
+    if orjson is not None and long_digits.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decide: it accepts NaN/Infinity, which orjson rejects,
+            # and raises the usual JSONDecodeError/UnicodeDecodeError otherwise.
+            pass
+    return json.loads(data)
 
 
 ENCODERS_BY_TYPE: dict[type[Any], Callable[[Any], Any]] = {
@@ -114,18 +143,18 @@ def jsonable_encoder(
         )
 
     # Handle Pydantic models
-    if HAS_PYDANTIC:
-        if hasattr(pydantic, "BaseModel") and isinstance(obj, pydantic.BaseModel):
-            return _encode_pydantic(
-                obj,
-                include=include,
-                exclude=exclude,
-                by_alias=by_alias,
-                exclude_unset=exclude_unset,
-                exclude_defaults=exclude_defaults,
-                exclude_none=exclude_none,
-                custom_encoder=custom_encoder,
-            )
+    pydantic_model = _pydantic_base_model()
+    if pydantic_model is not None and isinstance(obj, pydantic_model):
+        return _encode_pydantic(
+            obj,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            custom_encoder=custom_encoder,
+        )
 
     # Handle dataclasses
     if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
@@ -5,12 +5,44 @@ FastAPI-compatible application with revolutionary performance
 
 import asyncio
 import inspect
+import io
+import json
+import threading
+import weakref
 from collections.abc import Callable
+from http.cookies import SimpleCookie
 from typing import Any
+from urllib.parse import parse_qs
 
+from .async_limiter import AsyncLimiter
+from .datastructures import Body, Cookie, File, Form, Header, Query, UploadFile
+from .encoders import loads_json
+from .exceptions import HTTPException
+from .responses import JSONResponse, Response, StreamingResponse
 from .routing import Router
+from .security import get_depends
 from .version_check import CHECK_MARK, ROCKET
 
+# Handler results that can never be models; checked by exact type so the
+# common case skips the model_dump/dict attribute probes (each miss raises
+# AttributeError internally).
+_PLAIN_RESULT_TYPES = frozenset({dict, list, str, bytes, int, float, bool, type(None)})
+
+
+# Weakly keyed so handlers and dependencies that go away don't stay pinned.
+_signature_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    """inspect.signature, memoized for the handlers and dependencies hit per request."""
+    try:
+        sig = _signature_cache.get(func)
+    except TypeError:  # unhashable or not weakly referenceable
+        return inspect.signature(func)
+    if sig is None:
+        sig = _signature_cache[func] = inspect.signature(func)
+    return sig
+
 
 def _parse_multipart(body: bytes, boundary: str) -> tuple[dict, list]:
     """Parse multipart/form-data body into (form_fields, file_fields)."""
@@ -69,6 +101,9 @@ class TurboAPI(Router):
         redoc_url: str | None = "/redoc",
         openapi_url: str | None = "/openapi.json",
         lifespan: Callable | None = None,
+        max_concurrency: int | None = None,
+        max_queued: int | None = None,
+        queue_timeout: float | None = None,
         **kwargs,
     ):
         super().__init__()
@@ -86,6 +121,20 @@ class TurboAPI(Router):
         self._websocket_routes: dict[str, Callable] = {}
         self._exception_handlers: dict[type, Callable] = {}
         self._openapi_schema: dict | None = None
+        self._docs_cache: dict[str, tuple[Any, Any]] = {}
+        # Optional admission control for async handlers on the ASGI path:
+        # at most max_concurrency run at once; requests are rejected with 503
+        # once max_queued callers are waiting or after queue_timeout seconds
+        # without a slot.
+        if not max_concurrency and (max_queued is not None or queue_timeout is not None):
+            raise ValueError("max_queued and queue_timeout require max_concurrency")
+        self.max_concurrency = max_concurrency
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        # Keyed weakly by event loop, so limiters go away with their loop;
+        # created under a lock because worker threads each bring their own loop.
+        self._limiters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._limiters_lock = threading.Lock()
 
         print(f"{ROCKET} TurboAPI application created: {title} v{version}")
 
@@ -94,6 +143,31 @@ class TurboAPI(Router):
         """Get all registered routes."""
         return self.registry.get_routes() if hasattr(self, "registry") else []
 
+    def _admission_limiter(self) -> AsyncLimiter:
+        """Return this app's limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            with self._limiters_lock:
+                limiter = self._limiters.get(loop)
+                if limiter is None:
+                    limiter = AsyncLimiter(
+                        self.max_concurrency, self.max_queued, self.queue_timeout
+                    )
+                    self._limiters[loop] = limiter
+        return limiter
+
+    def admission_stats(self) -> dict[str, Any]:
+        """Report admission-control load, e.g. for a ``/load`` endpoint clients back off on."""
+        with self._limiters_lock:
+            limiters = list(self._limiters.values())
+        return {
+            "active": sum(limiter.active_tasks for limiter in limiters),
+            "waiting": sum(limiter.waiting_tasks for limiter in limiters),
+            "max_concurrency": self.max_concurrency,
+            "max_queued": self.max_queued,
+        }
+
     def add_middleware(self, middleware_class, **kwargs):
         """Add middleware to the application."""
         self.middleware_stack.append((middleware_class, kwargs))
@@ -152,7 +226,6 @@ class TurboAPI(Router):
         ``_MAX_STATIC_DEPTH`` segments. Each handler rebuilds the sub-path
         and calls ``static_app.get_file(sub)``.
         """
-        from .responses import Response as _Response
 
         for depth in range(1, self._MAX_STATIC_DEPTH + 1):
             segments = "/".join(f"{{p{i}}}" for i in range(1, depth + 1))
@@ -164,13 +237,13 @@ class TurboAPI(Router):
                     sub_path = "/".join(kwargs[n] for n in names if kwargs.get(n))
                     result = app_ref.get_file(sub_path)
                     if result is None:
-                        return _Response(
+                        return Response(
                             content=b"Not Found",
                             status_code=404,
                             media_type="text/plain",
                         )
                     content, content_type, size = result
-                    return _Response(
+                    return Response(
                         content=content,
                         status_code=200,
                         media_type=content_type,
@@ -245,6 +318,29 @@ class TurboAPI(Router):
             self._openapi_schema = generate_openapi_schema(self)
         return self._openapi_schema
 
+    def _docs_response(self, path: str):
+        """Return the OpenAPI/docs response for ``path``, rendered once and reused.
+
+        The OpenAPI JSON is re-rendered only when ``openapi()`` hands back a new
+        schema object; the HTML pages only when the title or schema URL change.
+        """
+        if path == self.openapi_url:
+            key: Any = self.openapi()
+            cached = self._docs_cache.get(path)
+            if cached is None or cached[0] is not key:
+                cached = self._docs_cache[path] = (key, JSONResponse(key))
+            return cached[1]
+
+        key = (self.title, self.openapi_url)
+        cached = self._docs_cache.get(path)
+        if cached is None or cached[0] != key:
+            from .openapi import get_redoc_html, get_swagger_ui_html
+
+            render = get_swagger_ui_html if path == self.docs_url else get_redoc_html
+            html = render(self.title, self.openapi_url or "/openapi.json")
+            cached = self._docs_cache[path] = (key, Response(html, media_type="text/html"))
+        return cached[1]
+
     async def _run_startup_handlers(self):
         """Run all startup event handlers."""
         print("[START] Running startup handlers...")
@@ -331,7 +427,7 @@ class TurboAPI(Router):
 
         try:
             # Prepare function arguments
-            sig = inspect.signature(route.handler)
+            sig = _signature(route.handler)
             call_args = {}
 
             # Add path parameters
@@ -485,23 +581,7 @@ class TurboAPI(Router):
         Use app.run() with the compiled Zig backend for production performance.
         This exists so the app is usable via uvicorn/granian before turbonet is built.
         """
-        import json as _json
-        from http.cookies import SimpleCookie
-        from urllib.parse import parse_qs
-
-        from .datastructures import Cookie as _Cookie
-        from .datastructures import File as _File
-        from .datastructures import Form as _Form
-        from .datastructures import Header as _Header
-        from .datastructures import Query as _Query
-        from .datastructures import UploadFile as _UF
-        from .exceptions import HTTPException as _HTTPException
-        from .responses import JSONResponse as _JSONResponse
-        from .responses import Response as _Response
-        from .responses import StreamingResponse as _StreamingResponse
-        from .security import get_depends as _get_depends
-
-        async def _send_response(response: _Response) -> None:
+        async def _send_response(response: Response) -> None:
             headers_out: list[list[bytes]] = []
             if getattr(response, "media_type", None):
                 headers_out.append([b"content-type", str(response.media_type).encode("latin-1")])
@@ -520,7 +600,7 @@ class TurboAPI(Router):
                     "headers": headers_out,
                 }
             )
-            if isinstance(response, _StreamingResponse):
+            if isinstance(response, StreamingResponse):
                 async for chunk in response.body_iterator():
                     await send({"type": "http.response.body", "body": chunk, "more_body": True})
                 await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -528,7 +608,7 @@ class TurboAPI(Router):
                 await send({"type": "http.response.body", "body": getattr(response, "body", b"")})
 
         async def _send_json(status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
-            await _send_response(_JSONResponse(payload, status_code=status, headers=headers))
+            await _send_response(JSONResponse(payload, status_code=status, headers=headers))
 
         def _annotation(param: inspect.Parameter):
             ann = param.annotation
@@ -555,8 +635,7 @@ class TurboAPI(Router):
             return value
 
         def _is_body_marker(default) -> bool:
-            from .datastructures import Body as _Body
-            return isinstance(default, (_Form, _File, _Body))
+            return isinstance(default, (Form, File, Body))
 
         def _cookie_map(cookie_header: str) -> dict[str, str]:
             parsed = SimpleCookie()
@@ -569,31 +648,36 @@ class TurboAPI(Router):
                 return await result
             return result
 
+        def _marker_value(name: str, default: Header | Cookie, context: dict[str, Any]):
+            if isinstance(default, Header):
+                key = default.alias or (name.replace("_", "-") if default.convert_underscores else name)
+                val = context["headers"].get(key.lower())
+            else:
+                val = context["cookies"].get(default.alias or name)
+            if val is None and default.default is not ...:
+                val = default.default
+            return val
+
         async def _resolve_dependency(dep, context: dict[str, Any]):
             dependency = dep.dependency
             if dependency is None:
                 return None
-            dep_sig = inspect.signature(dependency)
+            # Like FastAPI, a dependency shared by several parameters runs once
+            # per request unless it opts out with use_cache=False.
+            cache = context["dependencies"]
+            if dep.use_cache and id(dependency) in cache:
+                return cache[id(dependency)]
+            dep_sig = _signature(dependency)
             dep_args: dict[str, Any] = {}
             for name, param in dep_sig.parameters.items():
-                depends = _get_depends(param)
+                depends = get_depends(param)
                 if depends is not None:
                     dep_args[name] = await _resolve_dependency(depends, context)
                     continue
                 default = param.default
                 ann = _annotation(param)
-                if isinstance(default, _Header):
-                    key = default.alias or (name.replace("_", "-") if default.convert_underscores else name)
-                    val = context["headers"].get(key.lower())
-                    if val is None and default.default is not ...:
-                        val = default.default
-                    if val is not None:
-                        dep_args[name] = _coerce(val, ann)
-                elif isinstance(default, _Cookie):
-                    key = default.alias or name
-                    val = context["cookies"].get(key)
-                    if val is None and default.default is not ...:
-                        val = default.default
+                if isinstance(default, (Header, Cookie)):
+                    val = _marker_value(name, default, context)
                     if val is not None:
                         dep_args[name] = _coerce(val, ann)
                 elif name in context["query"]:
@@ -602,24 +686,28 @@ class TurboAPI(Router):
                     dep_args[name] = _coerce(context["headers"][name], ann)
                 elif param.default is not inspect.Parameter.empty:
                     dep_args[name] = param.default
-            return await _call_maybe_async(dependency, **dep_args)
+            result = await _call_maybe_async(dependency, **dep_args)
+            if dep.use_cache:
+                cache[id(dependency)] = result
+            return result
 
         async def _send_result(result: Any) -> None:
-            if isinstance(result, _Response):
+            if isinstance(result, Response):
                 await _send_response(result)
                 return
-            if hasattr(result, "model_dump"):
-                result = result.model_dump()
-            elif hasattr(result, "dict"):
-                result = result.dict()
+            if type(result) not in _PLAIN_RESULT_TYPES:
+                if hasattr(result, "model_dump"):
+                    result = result.model_dump()
+                elif hasattr(result, "dict"):
+                    result = result.dict()
             if isinstance(result, dict):
-                await _send_response(_JSONResponse(result))
+                await _send_response(JSONResponse(result))
             elif isinstance(result, str):
-                await _send_response(_Response(result, media_type="text/plain"))
+                await _send_response(Response(result, media_type="text/plain"))
             elif isinstance(result, bytes):
-                await _send_response(_Response(result, media_type="application/octet-stream"))
+                await _send_response(Response(result, media_type="application/octet-stream"))
             else:
-                await _send_response(_JSONResponse(result))
+                await _send_response(JSONResponse(result))
 
         if scope["type"] == "lifespan":
             lifespan_cm = None
@@ -657,30 +745,27 @@ class TurboAPI(Router):
         path = scope["path"]
         query_string = scope.get("query_string", b"").decode("utf-8", errors="replace")
 
-        body = b""
-        while True:
-            message = await receive()
-            body += message.get("body", b"")
-            if not message.get("more_body", False):
-                break
+        message = await receive()
+        body = message.get("body", b"")
+        if message.get("more_body", False):
+            # Chunked upload: join once instead of re-copying the body per chunk
+            chunks = [body]
+            while True:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    break
+            body = b"".join(chunks)
 
         headers = {}
         for hdr_name, hdr_val in scope.get("headers", []):
             headers[hdr_name.decode("latin-1").lower()] = hdr_val.decode("latin-1")
         cookies = _cookie_map(headers.get("cookie", ""))
         qs = parse_qs(query_string, keep_blank_values=True)
-        context = {"headers": headers, "cookies": cookies, "query": qs}
+        context = {"headers": headers, "cookies": cookies, "query": qs, "dependencies": {}}
 
-        if method == "GET" and self.openapi_url and path == self.openapi_url:
-            await _send_response(_JSONResponse(self.openapi()))
-            return
-        if method == "GET" and self.docs_url and path == self.docs_url:
-            from .openapi import get_swagger_ui_html
-            await _send_response(_Response(get_swagger_ui_html(self.title, self.openapi_url or "/openapi.json"), media_type="text/html"))
-            return
-        if method == "GET" and self.redoc_url and path == self.redoc_url:
-            from .openapi import get_redoc_html
-            await _send_response(_Response(get_redoc_html(self.title, self.openapi_url or "/openapi.json"), media_type="text/html"))
+        if method == "GET" and path in (self.openapi_url, self.docs_url, self.redoc_url):
+            await _send_response(self._docs_response(path))
             return
 
         match_result = self.registry.match_route(method, path)
@@ -689,7 +774,7 @@ class TurboAPI(Router):
             return
 
         route, path_params = match_result
-        sig = inspect.signature(route.handler)
+        sig = _signature(route.handler)
         call_args: dict[str, Any] = {}
 
         for param_name, param_value in path_params.items():
@@ -705,11 +790,11 @@ class TurboAPI(Router):
         for param_name, param in sig.parameters.items():
             if param_name in call_args:
                 continue
-            depends = _get_depends(param)
+            depends = get_depends(param)
             if depends is not None:
                 try:
                     call_args[param_name] = await _resolve_dependency(depends, context)
-                except _HTTPException as e:
+                except HTTPException as e:
                     await _send_json(e.status_code, {"detail": e.detail}, headers=e.headers)
                     return
                 except Exception as e:
@@ -718,24 +803,14 @@ class TurboAPI(Router):
                 continue
             default = param.default
             ann = _annotation(param)
-            if isinstance(default, _Query):
+            if isinstance(default, Query):
                 key = default.alias or param_name
                 if key in qs:
                     call_args[param_name] = _coerce(qs[key][0], ann)
                 elif default.default is not ...:
                     call_args[param_name] = default.default
-            elif isinstance(default, _Header):
-                key = default.alias or (param_name.replace("_", "-") if default.convert_underscores else param_name)
-                val = headers.get(key.lower())
-                if val is None and default.default is not ...:
-                    val = default.default
-                if val is not None:
-                    call_args[param_name] = _coerce(val, ann)
-            elif isinstance(default, _Cookie):
-                key = default.alias or param_name
-                val = cookies.get(key)
-                if val is None and default.default is not ...:
-                    val = default.default
+            elif isinstance(default, (Header, Cookie)):
+                val = _marker_value(param_name, default, context)
                 if val is not None:
                     call_args[param_name] = _coerce(val, ann)
             elif not _is_body_marker(default) and param_name in qs:
@@ -744,7 +819,6 @@ class TurboAPI(Router):
         if body:
             content_type_val = headers.get("content-type", "")
             if "multipart/form-data" in content_type_val:
-                import io as _io
                 boundary = ""
                 for _part in content_type_val.split(";"):
                     _part = _part.strip()
@@ -755,23 +829,23 @@ class TurboAPI(Router):
                     _form_fields, _file_fields = _parse_multipart(body, boundary)
                     _file_map = {f["name"]: f for f in _file_fields}
                     for param_name, param in sig.parameters.items():
-                        if param_name in call_args or _get_depends(param) is not None:
+                        if param_name in call_args or get_depends(param) is not None:
                             continue
                         default = param.default
                         ann = _annotation(param)
-                        is_file_default = isinstance(default, _File)
-                        is_upload_ann = ann is _UF
+                        is_file_default = isinstance(default, File)
+                        is_upload_ann = ann is UploadFile
                         if is_file_default or is_upload_ann:
                             field_name = default.alias if is_file_default and default.alias else param_name
                             if field_name in _file_map:
                                 fd = _file_map[field_name]
-                                call_args[param_name] = _UF(
+                                call_args[param_name] = UploadFile(
                                     filename=fd["filename"],
-                                    file=_io.BytesIO(fd["body"]),
+                                    file=io.BytesIO(fd["body"]),
                                     content_type=fd["content_type"],
                                     size=len(fd["body"]),
                                 )
-                        elif isinstance(default, _Form):
+                        elif isinstance(default, Form):
                             field_name = default.alias if default.alias else param_name
                             if field_name in _form_fields:
                                 call_args[param_name] = _coerce(_form_fields[field_name], ann)
@@ -780,11 +854,11 @@ class TurboAPI(Router):
             elif "application/x-www-form-urlencoded" in content_type_val:
                 _qs = parse_qs(body.decode("utf-8", errors="replace"), keep_blank_values=True)
                 for param_name, param in sig.parameters.items():
-                    if param_name in call_args or _get_depends(param) is not None:
+                    if param_name in call_args or get_depends(param) is not None:
                         continue
                     default = param.default
                     ann = _annotation(param)
-                    if isinstance(default, _Form):
+                    if isinstance(default, Form):
                         field_name = default.alias if default.alias else param_name
                         if field_name in _qs:
                             call_args[param_name] = _coerce(_qs[field_name][0], ann)
@@ -792,24 +866,29 @@ class TurboAPI(Router):
                             call_args[param_name] = default.default
             else:
                 try:
-                    json_body = _json.loads(body)
+                    json_body = loads_json(body)
                     for param_name, param in sig.parameters.items():
-                        if param_name in call_args or _get_depends(param) is not None:
+                        if param_name in call_args or get_depends(param) is not None:
                             continue
                         ann = _annotation(param)
                         if ann != inspect.Parameter.empty and hasattr(ann, "model_validate"):
                             call_args[param_name] = ann.model_validate(json_body)
                         elif param_name in (json_body if isinstance(json_body, dict) else {}):
                             call_args[param_name] = _coerce(json_body[param_name], ann)
-                except (_json.JSONDecodeError, Exception):
+                except (json.JSONDecodeError, Exception):
                     pass
 
         try:
             if asyncio.iscoroutinefunction(route.handler):
-                result = await route.handler(**call_args)
+                if self.max_concurrency:
+                    result = await self._admission_limiter()(route.handler(**call_args))
+                else:
+                    result = await route.handler(**call_args)
             else:
-                result = route.handler(**call_args)
-        except _HTTPException as e:
+                # Sync handlers may block (templates, file or DB I/O); keep them
+                # off the loop so concurrent requests are not stalled.
+                result = await asyncio.to_thread(route.handler, **call_args)
+        except HTTPException as e:
             await _send_json(e.status_code, {"detail": e.detail}, headers=e.headers)
             return
         except Exception as e:
@@ -14,12 +14,15 @@ Includes:
 import gzip
 import hashlib
 import hmac
+import logging
 import os
 import re
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 
+from ..logger import get_logger
 from ..models import Request, Response
 
 
@@ -97,6 +100,9 @@ class CORSMiddleware(Middleware):
         self._allow_headers_str = ", ".join(self.allow_headers)
         self._expose_headers_str = ", ".join(self.expose_headers) if self.expose_headers else ""
         self._max_age_str = str(self.max_age)
+        # Origin checks run on every response: O(1) set lookups, not list scans.
+        self._allow_any_origin = "*" in origins
+        self._origin_set = frozenset(origins)
 
     def before_request(self, request: Request) -> None:
         """Handle preflight OPTIONS requests."""
@@ -111,9 +117,9 @@ class CORSMiddleware(Middleware):
         # Check if origin is allowed
         if self.allow_origin_regex and self.allow_origin_regex.fullmatch(origin):
             response.set_header("Access-Control-Allow-Origin", origin)
-        elif "*" in self.allow_origins:
+        elif self._allow_any_origin:
             response.set_header("Access-Control-Allow-Origin", "*")
-        elif origin in self.allow_origins:
+        elif origin in self._origin_set:
             response.set_header("Access-Control-Allow-Origin", origin)
 
         response.set_header("Access-Control-Allow-Methods", self._allow_methods_str)
@@ -162,12 +168,24 @@ class TrustedHostMiddleware(Middleware):
                 pattern = host.replace(".", r"\.").replace("*", ".*")
                 self.allowed_host_patterns.append(re.compile(f"^{pattern}$"))
 
+        # Exact hosts are checked with one set lookup; only wildcard entries
+        # fall through to the regex scan.
+        self._allow_any_host = "*" in allowed_hosts
+        self._exact_hosts = frozenset(host for host in allowed_hosts if "*" not in host)
+        self._wildcard_patterns = [
+            pattern
+            for host, pattern in zip(allowed_hosts, self.allowed_host_patterns, strict=True)
+            if "*" in host
+        ]
+
     def before_request(self, request: Request) -> None:
         """Validate Host header."""
         host = request.headers.get("host", "").split(":")[0]
 
         # Check if host is allowed
-        if not any(pattern.match(host) for pattern in self.allowed_host_patterns):
+        if self._allow_any_host or host in self._exact_hosts:
+            return
+        if not any(pattern.match(host) for pattern in self._wildcard_patterns):
             raise Exception(f"Invalid host header: {host}")
 
 
@@ -306,8 +324,9 @@ class RateLimitMiddleware(Middleware):
     ):
         self.requests_per_minute = requests_per_minute
         self.burst = burst
-        self.requests = {}  # IP -> [(timestamp, count)]
+        self.requests: dict[str, deque[float]] = {}  # IP -> request times, oldest first
         self._lock = threading.Lock()
+        self._next_sweep = 0.0
         self.trusted_proxies = frozenset(trusted_proxies or ())
 
     def before_request(self, request: Request) -> None:
@@ -322,25 +341,30 @@ class RateLimitMiddleware(Middleware):
             )
         else:
             client_ip = peer_ip
-        now = time.time()
+        now = time.monotonic()
 
         with self._lock:
-            # Clean old requests
-            if client_ip in self.requests:
-                self.requests[client_ip] = [
-                    (ts, count) for ts, count in self.requests[client_ip] if now - ts < 60
-                ]
-
-            if client_ip not in self.requests:
-                self.requests[client_ip] = []
-
-            request_count = sum(count for _, count in self.requests[client_ip])
-
-            if request_count >= self.requests_per_minute:
+            # Drop clients idle for a full window so the table does not grow
+            # with every address ever seen; at most one sweep per window.
+            if now >= self._next_sweep:
+                self.requests = {
+                    ip: hits for ip, hits in self.requests.items() if hits and now - hits[-1] < 60
+                }
+                self._next_sweep = now + 60
+
+            hits = self.requests.get(client_ip)
+            if hits is None:
+                hits = self.requests[client_ip] = deque()
+
+            # Expire timestamps from the front instead of rebuilding the list
+            cutoff = now - 60
+            while hits and hits[0] <= cutoff:
+                hits.popleft()
+
+            if len(hits) >= self.requests_per_minute:
                 raise Exception("Rate limit exceeded")
 
-            # Add this request
-            self.requests[client_ip].append((now, 1))
+            hits.append(now)
 
 
 class LoggingMiddleware(Middleware):
@@ -349,18 +373,32 @@ class LoggingMiddleware(Middleware):
 
     Usage:
         app.add_middleware(LoggingMiddleware)
+
+    Lines go to the ``turboapi`` logger (see ``TURBO_LOG_LEVEL``); messages are
+    %-formatted lazily, so nothing is built when INFO is disabled.
     """
 
+    def __init__(self, logger: logging.Logger | None = None):
+        self.logger = logger or get_logger()
+
     def before_request(self, request: Request) -> None:
         """Log incoming request."""
-        request._start_time = time.time()
-        print(f"[REQUEST] {request.method} {request.path}")
+        request._start_time = time.perf_counter()
+        self.logger.info("[REQUEST] %s %s", request.method, request.path)
 
     def after_request(self, request: Request, response: Response) -> Response:
         """Log response with timing."""
-        duration = time.time() - getattr(request, "_start_time", time.time())
-        print(
-            f"[RESPONSE] {request.method} {request.path} -> {response.status_code} ({duration * 1000:.2f}ms)"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return response
+        # One clock read per request; the getattr default must not read the clock again
+        now = time.perf_counter()
+        duration = now - getattr(request, "_start_time", now)
+        self.logger.info(
+            "[RESPONSE] %s %s -> %s (%.2fms)",
+            request.method,
+            request.path,
+            response.status_code,
+            duration * 1000,
         )
         return response
 
@@ -6,6 +6,7 @@ Supports query parameters, path parameters, headers, request body, and dependenc
 
 import inspect
 import json
+import re
 import typing
 import urllib.parse
 from typing import Any, get_origin
@@ -13,11 +14,25 @@ from urllib.parse import parse_qs
 
 from dhi import BaseModel as Model
 
+from turboapi.async_pool import run_coroutine
+from turboapi.datastructures import File, Form, Header, UploadFile
+from turboapi.encoders import loads_json
 from turboapi.exceptions import HTTPException
+from turboapi.responses import JSONResponse, ORJSONResponse, Response
+from turboapi.security import Depends, SecurityBase, get_depends
 
 _NO_COERCION = object()
 
 
+async def _finish_async_generator(agen):
+    """Resume an async generator dependency past its ``yield`` so teardown runs."""
+    try:
+        await agen.__anext__()
+    except StopAsyncIteration:
+        return
+    await agen.aclose()  # yielded more than once; close it anyway
+
+
 def _returns_model(handler) -> bool | None:
     """Decide at handler-creation time whether `result.model_dump()` will be needed.
 
@@ -61,10 +76,9 @@ class DependencyResolver:
         Returns:
             Dictionary of resolved dependency values
         """
-        from turboapi.security import get_depends
-
         cache = {}
         cleanups = []  # generators to close after request
+        async_cleanups = []  # async generators, finished on the worker loop
         resolved = {}
 
         for param_name, param in handler_signature.parameters.items():
@@ -75,37 +89,154 @@ class DependencyResolver:
                     continue
 
                 value = DependencyResolver._resolve_single(
-                    dep_fn, depends.use_cache, context, cache, cleanups
+                    dep_fn, depends.use_cache, context, cache, cleanups, async_cleanups
                 )
                 resolved[param_name] = value
 
         # Store cleanups in context for later teardown
         context["_cleanups"] = cleanups
+        context["_async_cleanups"] = async_cleanups
         return resolved
 
     @staticmethod
-    def _resolve_single(dep_fn, use_cache, context, cache, cleanups):
-        """Resolve a single dependency, handling sub-deps, caching, generators."""
-        from turboapi.security import SecurityBase, get_depends
+    async def aresolve_dependencies(
+        handler_signature: inspect.Signature, context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Async-handler variant of resolve_dependencies.
+
+        Async dependencies are awaited on the loop already running the handler,
+        which is the worker thread's loop, so they cannot go through
+        run_coroutine.
+        """
+        cache = {}
+        cleanups = []
+        async_cleanups = []
+        resolved = {}
+
+        for param_name, param in handler_signature.parameters.items():
+            depends = get_depends(param)
+            if depends is not None:
+                dep_fn = depends.dependency
+                if dep_fn is None:
+                    continue
+
+                value = await DependencyResolver._aresolve_single(
+                    dep_fn, depends.use_cache, context, cache, cleanups, async_cleanups
+                )
+                resolved[param_name] = value
+
+        context["_cleanups"] = cleanups
+        context["_async_cleanups"] = async_cleanups
+        return resolved
 
+    @staticmethod
+    def run_cleanups(context: dict[str, Any]) -> None:
+        """Run the teardown (code after ``yield``) of generator dependencies."""
+        for gen in context.get("_cleanups", ()):
+            try:
+                next(gen)
+            except StopIteration:
+                pass
+            except Exception:
+                pass
+        for agen in context.get("_async_cleanups", ()):
+            try:
+                run_coroutine(_finish_async_generator(agen))
+            except Exception:
+                pass
+
+    @staticmethod
+    async def arun_cleanups(context: dict[str, Any]) -> None:
+        """Async-handler variant of run_cleanups; awaits async teardowns in place."""
+        for gen in context.get("_cleanups", ()):
+            try:
+                next(gen)
+            except StopIteration:
+                pass
+            except Exception:
+                pass
+        for agen in context.get("_async_cleanups", ()):
+            try:
+                await _finish_async_generator(agen)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _resolve_single(dep_fn, use_cache, context, cache, cleanups, async_cleanups):
+        """Resolve a single dependency, handling sub-deps, caching, generators."""
         cache_key = id(dep_fn)
         if use_cache and cache_key in cache:
             return cache[cache_key]
 
         # First resolve any sub-dependencies this function needs
         sub_kwargs = {}
-        if callable(dep_fn):
-            try:
-                sig = inspect.signature(dep_fn)
-                for p_name, p in sig.parameters.items():
-                    sub_dep = get_depends(p)
-                    if sub_dep is not None and sub_dep.dependency is not None:
-                        sub_kwargs[p_name] = DependencyResolver._resolve_single(
-                            sub_dep.dependency, sub_dep.use_cache, context, cache, cleanups
-                        )
-            except (ValueError, TypeError):
-                pass
+        for p_name, sub_dep in DependencyResolver._sub_dependencies(dep_fn):
+            sub_kwargs[p_name] = DependencyResolver._resolve_single(
+                sub_dep.dependency, sub_dep.use_cache, context, cache, cleanups, async_cleanups
+            )
+
+        if inspect.isasyncgenfunction(dep_fn):
+            # Reuse the worker thread's event loop instead of building and
+            # tearing down a fresh one per dependency (asyncio.run). The loop
+            # outlives the request, so the generator is finished explicitly
+            # in run_cleanups rather than by loop shutdown.
+            agen = dep_fn(**sub_kwargs)
+            result = run_coroutine(agen.__anext__())
+            async_cleanups.append(agen)
+        elif inspect.iscoroutinefunction(dep_fn):
+            result = run_coroutine(dep_fn(**sub_kwargs))
+        else:
+            result = DependencyResolver._call_sync(dep_fn, sub_kwargs, context, cleanups)
+
+        if use_cache:
+            cache[cache_key] = result
+        return result
+
+    @staticmethod
+    async def _aresolve_single(dep_fn, use_cache, context, cache, cleanups, async_cleanups):
+        """Async variant of _resolve_single; awaits async dependencies directly."""
+        cache_key = id(dep_fn)
+        if use_cache and cache_key in cache:
+            return cache[cache_key]
+
+        sub_kwargs = {}
+        for p_name, sub_dep in DependencyResolver._sub_dependencies(dep_fn):
+            sub_kwargs[p_name] = await DependencyResolver._aresolve_single(
+                sub_dep.dependency, sub_dep.use_cache, context, cache, cleanups, async_cleanups
+            )
+
+        if inspect.isasyncgenfunction(dep_fn):
+            agen = dep_fn(**sub_kwargs)
+            result = await agen.__anext__()
+            async_cleanups.append(agen)
+        elif inspect.iscoroutinefunction(dep_fn):
+            result = await dep_fn(**sub_kwargs)
+        else:
+            result = DependencyResolver._call_sync(dep_fn, sub_kwargs, context, cleanups)
+
+        if use_cache:
+            cache[cache_key] = result
+        return result
 
+    @staticmethod
+    def _sub_dependencies(dep_fn):
+        """Return ``(param name, Depends)`` pairs for the dependencies dep_fn declares."""
+        if not callable(dep_fn):
+            return []
+        try:
+            sig = inspect.signature(dep_fn)
+        except (ValueError, TypeError):
+            return []
+        subs = []
+        for p_name, p in sig.parameters.items():
+            sub_dep = get_depends(p)
+            if sub_dep is not None and sub_dep.dependency is not None:
+                subs.append((p_name, sub_dep))
+        return subs
+
+    @staticmethod
+    def _call_sync(dep_fn, sub_kwargs, context, cleanups):
+        """Call a security scheme, sync generator or plain dependency."""
         # Check if it's a security scheme callable
         if isinstance(dep_fn, SecurityBase) and hasattr(dep_fn, "__call__"):
             # Inspect __call__ signature to pass the right context
@@ -141,25 +272,8 @@ class DependencyResolver:
             gen = dep_fn(**sub_kwargs)
             result = next(gen)
             cleanups.append(gen)
-        elif inspect.isasyncgenfunction(dep_fn):
-            import asyncio
-
-            async def _resolve_async_gen():
-                agen = dep_fn(**sub_kwargs)
-                val = await agen.__anext__()
-                cleanups.append(agen)
-                return val
-
-            result = asyncio.run(_resolve_async_gen())
-        elif inspect.iscoroutinefunction(dep_fn):
-            import asyncio
-
-            result = asyncio.run(dep_fn(**sub_kwargs))
         else:
             result = dep_fn(**sub_kwargs)
-
-        if use_cache:
-            cache[cache_key] = result
         return result
 
 
@@ -275,8 +389,6 @@ class PathParamParser:
         Returns:
             Dictionary of extracted path parameters (type-coerced if signature provided)
         """
-        import re
-
         # Convert route pattern to regex
         # Replace {param} with named capture groups
         pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", route_pattern)
@@ -323,10 +435,14 @@ class HeaderParser:
         Returns:
             Dictionary of parsed header parameters
         """
-        from turboapi.datastructures import Header
-
         parsed_headers = {}
 
+        # Lower-case header names once instead of rescanning per parameter;
+        # the first occurrence wins, as with the previous linear search.
+        lowered: dict[str, str] = {}
+        for header_name, header_value in headers_dict.items():
+            lowered.setdefault(header_name.lower(), header_value)
+
         # Check each parameter in handler signature
         for param_name, param in handler_signature.parameters.items():
             # Check if this parameter uses Header() marker
@@ -343,21 +459,16 @@ class HeaderParser:
                     header_key = param_name.lower()
 
                 # Find matching header
-                for header_name, header_value in headers_dict.items():
-                    if header_name.lower() == header_key:
-                        parsed_headers[param_name] = header_value
-                        break
-                else:
+                if header_key in lowered:
+                    parsed_headers[param_name] = lowered[header_key]
+                elif header_marker.default is not ...:
                     # No matching header found, use default if available
-                    if header_marker.default is not ...:
-                        parsed_headers[param_name] = header_marker.default
+                    parsed_headers[param_name] = header_marker.default
             else:
                 # Not a Header marker, but still try to match by name
                 header_key = param_name.replace("_", "-").lower()
-                for header_name, header_value in headers_dict.items():
-                    if header_name.lower() == header_key:
-                        parsed_headers[param_name] = header_value
-                        break
+                if header_key in lowered:
+                    parsed_headers[param_name] = lowered[header_key]
 
         return parsed_headers
 
@@ -387,11 +498,11 @@ class RequestBodyParser:
 
         try:
             if type(body) is bytes:
-                json_data = json.loads(body)
+                json_data = loads_json(body)
             else:
                 # Force a real copy for mutable or foreign buffer-like inputs.
                 body_copy = bytes(bytearray(body))
-                json_data = json.loads(body_copy)
+                json_data = loads_json(body_copy)
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise RequestParsingError(f"Invalid JSON body: {e}")
 
@@ -399,8 +510,6 @@ class RequestBodyParser:
         params_list = list(handler_signature.parameters.items())
 
         # Filter out Depends/Security parameters — they are resolved separately
-        from turboapi.security import Depends, SecurityBase, get_depends
-
         body_params_list = [
             (name, p)
             for name, p in params_list
@@ -515,19 +624,9 @@ class RequestBodyParser:
 
 def _create_simple_json_body_parser(handler_signature: inspect.Signature):
     """Precompute the common scalar JSON body parser used by fast routes."""
-    try:
-        from turboapi.security import Depends, SecurityBase, get_depends
-
-        dependency_marker_types = (Depends, SecurityBase)
-    except ImportError:
-        dependency_marker_types = ()
-
-        def get_depends(_param):  # type: ignore[no-redef]
-            return None
-
     plan = []
     for param_name, param in handler_signature.parameters.items():
-        if isinstance(param.default, dependency_marker_types) or get_depends(param) is not None:
+        if isinstance(param.default, (Depends, SecurityBase)) or get_depends(param) is not None:
             return None
 
         annotation = param.annotation
@@ -548,9 +647,9 @@ def _create_simple_json_body_parser(handler_signature: inspect.Signature):
     def parse_body(body: bytes) -> dict[str, Any]:
         try:
             if type(body) is bytes:
-                json_data = json.loads(body)
+                json_data = loads_json(body)
             else:
-                json_data = json.loads(bytes(bytearray(body)))
+                json_data = loads_json(bytes(bytearray(body)))
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise RequestParsingError(f"Invalid JSON body: {e}") from e
 
@@ -576,6 +675,40 @@ def _create_simple_json_body_parser(handler_signature: inspect.Signature):
     return parse_body
 
 
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _make_serializable(obj):
+    """Convert a handler result into JSON-ready primitives (models, bytes, tuples)."""
+    obj_type = type(obj)
+    # Exact-type checks first: the common leaves and containers skip the isinstance chain
+    if obj_type in _JSON_SCALAR_TYPES:
+        return obj
+    if obj_type is dict:
+        return {k: _make_serializable(v) for k, v in obj.items()}
+    if obj_type is list:
+        return [_make_serializable(item) for item in obj]
+    if isinstance(obj, Model):
+        return obj.model_dump()
+    elif isinstance(obj, bytes):
+        # Non-binary bytes - try to decode as UTF-8, otherwise base64 encode
+        try:
+            return obj.decode("utf-8")
+        except UnicodeDecodeError:
+            import base64
+
+            return base64.b64encode(obj).decode("ascii")
+    elif isinstance(obj, dict):
+        return {k: _make_serializable(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_make_serializable(item) for item in obj]
+    elif isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    else:
+        # Try to convert to string for unknown types
+        return str(obj)
+
+
 def _is_binary_content_type(content_type: str) -> bool:
     """Check if the content type indicates binary data."""
     if not content_type:
@@ -618,8 +751,6 @@ class ResponseHandler:
             Tuple of (content, status_code) or (content, status_code, content_type)
         """
         # Handle Response objects (JSONResponse, HTMLResponse, etc.)
-        from turboapi.responses import Response
-
         if isinstance(result, Response):
             # Extract content from Response object
             body = result.body
@@ -648,11 +779,17 @@ class ResponseHandler:
                     return body, result.status_code, content_type, extra_headers
                 return body, result.status_code, content_type
 
-            if isinstance(body, bytes):
+            if type(result) is JSONResponse and result.content is body:
+                # Body is still what JSONResponse rendered from its content, so
+                # hand back the content instead of re-parsing that JSON.
+                body = result._content
+            elif isinstance(result, ORJSONResponse):
+                # Already rendered by orjson. Zig sends string content as-is, so
+                # pass it through rather than parsing it back for json.dumps.
+                body = body.decode("utf-8")
+            elif isinstance(body, bytes):
                 # Try to decode as JSON for JSONResponse
                 try:
-                    import json
-
                     body = json.loads(body.decode("utf-8"))
                 except json.JSONDecodeError:
                     # Not JSON, try as plain text
@@ -729,28 +866,7 @@ class ResponseHandler:
             content = content.model_dump()
 
         # Recursively convert any nested Satya models in dicts/lists
-        def make_serializable(obj):
-            if isinstance(obj, Model):
-                return obj.model_dump()
-            elif isinstance(obj, bytes):
-                # Non-binary bytes - try to decode as UTF-8, otherwise base64 encode
-                try:
-                    return obj.decode("utf-8")
-                except UnicodeDecodeError:
-                    import base64
-
-                    return base64.b64encode(obj).decode("ascii")
-            elif isinstance(obj, dict):
-                return {k: make_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                return [make_serializable(item) for item in obj]
-            elif isinstance(obj, (str, int, float, bool, type(None))):
-                return obj
-            else:
-                # Try to convert to string for unknown types
-                return str(obj)
-
-        content = make_serializable(content)
+        content = _make_serializable(content)
 
         result = {
             "content": content,
@@ -846,43 +962,63 @@ def create_enhanced_handler(original_handler, route_definition):
             _request_param_names.add(_pname)
     _skip_json_body = bool(_raw_body_param_names or _request_param_names)
 
-    from turboapi.datastructures import Header
-
-    try:
-        from turboapi.security import Depends, SecurityBase, get_depends
-
-        _has_security = True
-    except ImportError:
-        _has_security = False
-    try:
-        from turboapi.datastructures import File, Form
-        from turboapi.datastructures import UploadFile as _UploadFile
-
-        _has_form_types = True
-    except ImportError:
-        _has_form_types = False
-
     for pname, param in sig.parameters.items():
         if isinstance(param.default, Header):
             _has_header_params = True
-        elif _has_form_types and isinstance(param.default, (Form, File)):
+        elif isinstance(param.default, (Form, File)):
             _has_form_params = True
-        elif _has_form_types and (
-            param.annotation is _UploadFile
-            or (isinstance(param.annotation, type) and issubclass(param.annotation, _UploadFile))
+        elif param.annotation is UploadFile or (
+            isinstance(param.annotation, type) and issubclass(param.annotation, UploadFile)
         ):
             _has_form_params = True
         elif not (
-            _has_security
-            and (
-                isinstance(param.default, (Depends, SecurityBase)) or get_depends(param) is not None
-            )
-        ):
-            _has_header_params = True
-        if _has_security and (
             isinstance(param.default, (Depends, SecurityBase)) or get_depends(param) is not None
         ):
+            _has_header_params = True
+        if isinstance(param.default, (Depends, SecurityBase)) or get_depends(param) is not None:
             _has_dependencies = True
+
+    # Form / File / UploadFile bindings, classified once per route:
+    # (param name, multipart field name, is file, default or ...)
+    _form_plan: list[tuple[str, str, bool, Any]] = []
+    if _has_form_params:
+        for pname, param in sig.parameters.items():
+            if isinstance(param.default, Form):
+                _form_plan.append(
+                    (pname, param.default.alias or pname, False, param.default.default)
+                )
+            elif isinstance(param.default, File):
+                _form_plan.append(
+                    (pname, param.default.alias or pname, True, param.default.default)
+                )
+            elif param.annotation is UploadFile or (
+                isinstance(param.annotation, type) and issubclass(param.annotation, UploadFile)
+            ):
+                _form_plan.append((pname, pname, True, ...))
+
+    def _resolve_form_params(form_fields, file_fields, parsed_params):
+        for pname, key, is_file, default in _form_plan:
+            if is_file:
+                for part in file_fields:
+                    if part.get("name") == key:
+                        body = part.get("body", b"")
+                        uf = UploadFile(
+                            filename=part.get("filename"),
+                            content_type=part.get("content_type", "application/octet-stream"),
+                            size=len(body),
+                        )
+                        uf.file.write(body)
+                        uf.file.seek(0)
+                        parsed_params[pname] = uf
+                        break
+                else:
+                    if default is not ...:
+                        parsed_params[pname] = default
+            elif key in form_fields:
+                parsed_params[pname] = form_fields[key]
+            elif default is not ...:
+                parsed_params[pname] = default
+
     if is_async:
         # Create async enhanced handler for async original handlers
         async def enhanced_handler(**kwargs):
@@ -918,57 +1054,7 @@ def create_enhanced_handler(original_handler, route_definition):
                 _form_fields = kwargs.get("form_fields", {})
                 _file_fields = kwargs.get("file_fields", [])
                 if _has_form_params:
-                    for pname, param in sig.parameters.items():
-                        if _has_form_types and isinstance(param.default, Form):
-                            key = param.default.alias or pname
-                            if key in _form_fields:
-                                parsed_params[pname] = _form_fields[key]
-                            elif param.default.default is not ...:
-                                parsed_params[pname] = param.default.default
-                        elif _has_form_types and isinstance(param.default, File):
-                            key = param.default.alias or pname
-                            matched = None
-                            for ff in _file_fields:
-                                if ff.get("name") == key:
-                                    matched = ff
-                                    break
-                            if matched:
-                                uf = _UploadFile(
-                                    filename=matched.get("filename"),
-                                    content_type=matched.get(
-                                        "content_type", "application/octet-stream"
-                                    ),
-                                    size=len(matched.get("body", b"")),
-                                )
-                                uf.file.write(matched.get("body", b""))
-                                uf.file.seek(0)
-                                parsed_params[pname] = uf
-                            elif param.default.default is not ...:
-                                parsed_params[pname] = param.default.default
-                        elif _has_form_types and (
-                            param.annotation is _UploadFile
-                            or (
-                                isinstance(param.annotation, type)
-                                and issubclass(param.annotation, _UploadFile)
-                            )
-                        ):
-                            key = pname
-                            matched = None
-                            for ff in _file_fields:
-                                if ff.get("name") == key:
-                                    matched = ff
-                                    break
-                            if matched:
-                                uf = _UploadFile(
-                                    filename=matched.get("filename"),
-                                    content_type=matched.get(
-                                        "content_type", "application/octet-stream"
-                                    ),
-                                    size=len(matched.get("body", b"")),
-                                )
-                                uf.file.write(matched.get("body", b""))
-                                uf.file.seek(0)
-                                parsed_params[pname] = uf
+                    _resolve_form_params(_form_fields, _file_fields, parsed_params)
 
                 # 3.7. Raw body / Request injection — FastAPI-compat access
                 # to the unparsed request body.
@@ -1005,7 +1091,7 @@ def create_enhanced_handler(original_handler, route_definition):
                     "query_string": kwargs.get("query_string", ""),
                     "body": kwargs.get("body", b""),
                 }
-                dependency_params = DependencyResolver.resolve_dependencies(sig, context)
+                dependency_params = await DependencyResolver.aresolve_dependencies(sig, context)
                 parsed_params.update(dependency_params)
 
                 # Filter to only pass expected parameters
@@ -1015,14 +1101,7 @@ def create_enhanced_handler(original_handler, route_definition):
                 result = await original_handler(**filtered_kwargs)
 
                 # Run dependency cleanups (generator teardown)
-                cleanups = context.get("_cleanups", [])
-                for gen in cleanups:
-                    try:
-                        next(gen)
-                    except StopIteration:
-                        pass
-                    except Exception:
-                        pass
+                await DependencyResolver.arun_cleanups(context)
 
                 # Normalize response - may return 2, 3, or 4-element tuple
                 normalized = ResponseHandler.normalize_response(result)
@@ -1101,57 +1180,7 @@ def create_enhanced_handler(original_handler, route_definition):
                 _form_fields = kwargs.get("form_fields", {})
                 _file_fields = kwargs.get("file_fields", [])
                 if _has_form_params:
-                    for pname, param in sig.parameters.items():
-                        if _has_form_types and isinstance(param.default, Form):
-                            key = param.default.alias or pname
-                            if key in _form_fields:
-                                parsed_params[pname] = _form_fields[key]
-                            elif param.default.default is not ...:
-                                parsed_params[pname] = param.default.default
-                        elif _has_form_types and isinstance(param.default, File):
-                            key = param.default.alias or pname
-                            matched = None
-                            for ff in _file_fields:
-                                if ff.get("name") == key:
-                                    matched = ff
-                                    break
-                            if matched:
-                                uf = _UploadFile(
-                                    filename=matched.get("filename"),
-                                    content_type=matched.get(
-                                        "content_type", "application/octet-stream"
-                                    ),
-                                    size=len(matched.get("body", b"")),
-                                )
-                                uf.file.write(matched.get("body", b""))
-                                uf.file.seek(0)
-                                parsed_params[pname] = uf
-                            elif param.default.default is not ...:
-                                parsed_params[pname] = param.default.default
-                        elif _has_form_types and (
-                            param.annotation is _UploadFile
-                            or (
-                                isinstance(param.annotation, type)
-                                and issubclass(param.annotation, _UploadFile)
-                            )
-                        ):
-                            key = pname
-                            matched = None
-                            for ff in _file_fields:
-                                if ff.get("name") == key:
-                                    matched = ff
-                                    break
-                            if matched:
-                                uf = _UploadFile(
-                                    filename=matched.get("filename"),
-                                    content_type=matched.get(
-                                        "content_type", "application/octet-stream"
-                                    ),
-                                    size=len(matched.get("body", b"")),
-                                )
-                                uf.file.write(matched.get("body", b""))
-                                uf.file.seek(0)
-                                parsed_params[pname] = uf
+                    _resolve_form_params(_form_fields, _file_fields, parsed_params)
 
                 # 3.7. Raw body / Request injection — FastAPI-compat access
                 # to the unparsed request body.
@@ -1198,14 +1227,7 @@ def create_enhanced_handler(original_handler, route_definition):
 
                 # Run dependency cleanups (generator teardown)
                 if _has_dependencies:
-                    cleanups = context.get("_cleanups", [])
-                    for gen in cleanups:
-                        try:
-                            next(gen)
-                        except StopIteration:
-                            pass
-                        except Exception:
-                            pass
+                    DependencyResolver.run_cleanups(context)
 
                 # Normalize response - may return 2, 3, or 4-element tuple
                 normalized = ResponseHandler.normalize_response(result)
@@ -1541,7 +1563,7 @@ def create_fast_model_handler(original_handler, model_class, param_name):
     """
     import json as _json
 
-    _loads = _json.loads
+    _loads = loads_json
     _dumps = _json.dumps
     _returns_md = _returns_model(original_handler)
 
@@ -1,15 +1,169 @@
 """Response classes for TurboAPI.
 
-FastAPI-compatible response types: JSONResponse, HTMLResponse, PlainTextResponse,
-StreamingResponse, FileResponse, RedirectResponse.
+FastAPI-compatible response types: JSONResponse, ORJSONResponse, HTMLResponse,
+PlainTextResponse, StreamingResponse, FileResponse, RedirectResponse.
 """
 
+import asyncio
 import json
 import mimetypes
 import os
+import threading
 from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Marks the end of a sync stream produced in a worker thread
+_STREAM_EXHAUSTED = object()
+
+# How many chunks a sync stream's producer thread may run ahead of the client
+_SYNC_STREAM_BUFFER = 16
+
+# Producer threads for sync streams are pooled rather than spawned per response.
+# A stream borrows a worker only while its iterator is producing a batch of
+# chunks, so TURBO_STREAM_WORKERS caps how many blocking producers run at once
+# without slow clients pinning workers.
+_stream_executor: ThreadPoolExecutor | None = None
+_stream_executor_lock = threading.Lock()
+
+
+def _get_stream_executor() -> ThreadPoolExecutor:
+    global _stream_executor
+    if _stream_executor is None:
+        with _stream_executor_lock:
+            if _stream_executor is None:
+                _stream_executor = ThreadPoolExecutor(
+                    max_workers=int(os.environ.get("TURBO_STREAM_WORKERS", "64")),
+                    thread_name_prefix="turboapi-stream",
+                )
+    return _stream_executor
+
+
+async def _iterate_in_thread(iterator: Iterator, buffer_size: int):
+    """Drive a blocking iterator on pooled threads and yield its chunks.
+
+    The iterator is advanced in batches that fill the free part of the buffer;
+    each batch runs as one pool task and returns its worker when done, so a
+    stalled client never holds a thread. The next batch is submitted once the
+    client has drained half the buffer. str chunks are encoded in the worker,
+    and chunks reach the loop via ``call_soon_threadsafe``, so the consumer
+    wakes exactly when data is ready.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_stream_executor()
+    queue: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+    failure: list[Exception] = []
+    refill_at = buffer_size // 2
+    running = False  # a batch is in flight; only touched on the loop thread
+
+    def close() -> None:
+        close_iterator = getattr(iterator, "close", None)
+        if close_iterator is not None:
+            close_iterator()
+
+    def produce(count: int) -> None:
+        finished = True
+        try:
+            for _ in range(count):
+                if stopped.is_set():
+                    break
+                chunk = next(iterator, _STREAM_EXHAUSTED)
+                if chunk is _STREAM_EXHAUSTED:
+                    break
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            else:
+                finished = False
+        except Exception as exc:
+            failure.append(exc)
+        if stopped.is_set():
+            close()
+            finished = True
+        try:
+            loop.call_soon_threadsafe(batch_done, finished)
+        except RuntimeError:
+            pass  # loop already closed; nobody is listening
+
+    def submit() -> None:
+        nonlocal running
+        running = True
+        executor.submit(produce, buffer_size - queue.qsize())
+
+    def batch_done(finished: bool) -> None:
+        nonlocal running
+        running = False
+        if finished:
+            queue.put_nowait(_STREAM_EXHAUSTED)
+        elif stopped.is_set():
+            executor.submit(close)  # consumer left while the batch was running
+        elif queue.qsize() <= refill_at:
+            submit()
+
+    submit()
+    exhausted = False
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is _STREAM_EXHAUSTED:
+                exhausted = True
+                if failure:
+                    raise failure[0]
+                return
+            if not running and queue.qsize() <= refill_at:
+                submit()
+            yield chunk
+    finally:
+        stopped.set()
+        if not running and not exhausted:
+            executor.submit(close)  # no batch will see the stop; close it here
+
+
+async def _prefetch(source: AsyncIterator, size: int):
+    """Drive an async source in its own task, at most ``size`` chunks ahead.
+
+    The source's own awaits (a database fetch, a model step) then overlap with
+    sending the previous chunk to the client, and the bounded queue keeps a
+    fast source from running arbitrarily far ahead of a slow client.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+    failure: list[Exception] = []
+
+    async def produce() -> None:
+        try:
+            async for chunk in source:
+                await queue.put(chunk)
+        except Exception as exc:
+            failure.append(exc)
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(_STREAM_EXHAUSTED)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is _STREAM_EXHAUSTED:
+                if failure:
+                    raise failure[0]
+                return
+            yield chunk
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
 
 class Response:
     """Base response class."""
@@ -65,19 +219,20 @@ class Response:
         samesite: str | None = "lax",
     ) -> None:
         """Set a cookie on the response."""
-        cookie = f"{key}={value}; Path={path}"
+        parts = [f"{key}={value}", f"Path={path}"]
         if max_age is not None:
-            cookie += f"; Max-Age={max_age}"
+            parts.append(f"Max-Age={max_age}")
         if expires is not None:
-            cookie += f"; Expires={expires}"
+            parts.append(f"Expires={expires}")
         if domain:
-            cookie += f"; Domain={domain}"
+            parts.append(f"Domain={domain}")
         if secure:
-            cookie += "; Secure"
+            parts.append("Secure")
         if httponly:
-            cookie += "; HttpOnly"
+            parts.append("HttpOnly")
         if samesite:
-            cookie += f"; SameSite={samesite}"
+            parts.append(f"SameSite={samesite}")
+        cookie = "; ".join(parts)
         self._cookies.append(cookie)
         # Also expose in headers dict for direct access (FastAPI compat)
         existing = self.headers.get("set-cookie")
@@ -109,6 +264,20 @@ class JSONResponse(Response):
         ).encode("utf-8")
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (requires the ``orjson`` extra).
+
+    Several times faster than JSONResponse for large payloads. Like FastAPI's
+    ORJSONResponse it follows orjson's rules, so NaN and infinities render as
+    ``null`` instead of raising.
+    """
+
+    def _render(self, content: Any) -> bytes:
+        if orjson is None:
+            raise RuntimeError("ORJSONResponse requires orjson: pip install turboapi[orjson]")
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
 class HTMLResponse(Response):
     """HTML response."""
 
@@ -152,6 +321,11 @@ class StreamingResponse(Response):
         @app.get("/stream")
         def stream():
             return StreamingResponse(generate(), media_type="text/event-stream")
+
+    ``prefetch`` lets the source produce up to that many chunks ahead of the
+    client, so producing the next chunk overlaps with sending the current one.
+    Async sources are consumed inline by default (0); sync sources always run
+    in a worker thread with a buffer of 16 unless ``prefetch`` is given.
     """
 
     def __init__(
@@ -160,29 +334,35 @@ class StreamingResponse(Response):
         status_code: int = 200,
         headers: dict[str, str] | None = None,
         media_type: str | None = None,
+        prefetch: int = 0,
     ):
         self.status_code = status_code
         self.headers = headers or {}
         if media_type:
             self.media_type = media_type
         self._content_iterator = content
+        self.prefetch = prefetch
         self.body = b""  # Will be streamed
         self._cookies: list[str] = []
 
     async def body_iterator(self) -> AsyncIterator[bytes]:
         """Iterate over the response body chunks."""
         if hasattr(self._content_iterator, "__aiter__"):
-            async for chunk in self._content_iterator:
+            source = self._content_iterator
+            if self.prefetch > 0:
+                source = _prefetch(source, self.prefetch)
+            async for chunk in source:
                 if isinstance(chunk, str):
                     yield chunk.encode("utf-8")
                 else:
                     yield chunk
         else:
-            for chunk in self._content_iterator:
-                if isinstance(chunk, str):
-                    yield chunk.encode("utf-8")
-                else:
-                    yield chunk
+            # Sync iterators may block (file reads, DB cursors), so run them in a
+            # producer thread instead of stalling the event loop.
+            buffer_size = self.prefetch or _SYNC_STREAM_BUFFER
+            stream = _iterate_in_thread(iter(self._content_iterator), buffer_size)
+            async for chunk in stream:
+                yield chunk
 
 
 class FileResponse(Response):
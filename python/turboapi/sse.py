@@ -5,14 +5,64 @@ Compatible with FastAPI's EventSourceResponse.
 
 import asyncio
 import json
+import math
+from collections import deque
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
 from .responses import StreamingResponse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _finite(data: Any) -> Any:
+    """Replace NaN/Infinity with None, as orjson renders them."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(item) for item in data]
+    return data
+
+
+def _dumps_stdlib(data: Any) -> str:
+    try:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError as exc:
+        if "Out of range float" not in str(exc):
+            raise
+    # NaN/Infinity are not JSON; emit null so the output matches the orjson path.
+    return json.dumps(_finite(data), ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps_data(data: Any) -> str:
+    """Serialize an event payload to compact JSON, preferring orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            # orjson rejects some inputs the stdlib accepts (e.g. non-str dict keys,
+            # ints beyond 64 bits) — fall through so behaviour stays the same.
+            pass
+    return _dumps_stdlib(data)
+
+
+def _dumps_data_bytes(data: Any) -> bytes:
+    """Like _dumps_data, but returns UTF-8 bytes (orjson's native output, no decode)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return _dumps_stdlib(data).encode("utf-8")
+
+
+@dataclass(slots=True)
 class ServerSentEvent:
     """Represents a single SSE event."""
 
@@ -47,18 +97,47 @@ def format_sse_event(evt: ServerSentEvent) -> str:
     # Serialize data
     if evt.data is not None:
         if isinstance(evt.data, str):
-            data_str = evt.data
+            for line in evt.data.splitlines():
+                lines.append(f"data: {line}")
         else:
-            data_str = json.dumps(evt.data)
-
-        for line in data_str.splitlines():
-            lines.append(f"data: {line}")
+            # Compact JSON never contains raw line breaks: always a single data line
+            lines.append(f"data: {_dumps_data(evt.data)}")
 
     lines.append("")  # trailing newline
     lines.append("")  # double newline terminates event
     return "\n".join(lines)
 
 
+# Static wire fragments, built once rather than formatted per event
+_DATA_PREFIX = b"data: "
+_EVENT_END = b"\n\n"
+_PING = format_sse_event(ServerSentEvent(comment="ping")).encode("utf-8")
+
+# How many encoded frames an EventSourceResponse source may run ahead of the client.
+_READ_AHEAD = 16
+
+
+def _encode_data_only(data: Any) -> bytes:
+    """Encode a bare item yielded by an SSE source straight to wire bytes."""
+    if isinstance(data, str):
+        lines = data.splitlines()
+        if not lines:
+            return b"\n"
+        return ("data: " + "\ndata: ".join(lines) + "\n\n").encode("utf-8")
+    if data is None:
+        return b"\n"
+    return _DATA_PREFIX + _dumps_data_bytes(data) + _EVENT_END
+
+
+def _encode_frame(item: Any) -> bytes:
+    """Encode one item from an SSE source (event object or bare payload) to bytes."""
+    if isinstance(item, ServerSentEvent):
+        if item.event is None and item.id is None and item.retry is None and item.comment is None:
+            return _encode_data_only(item.data)
+        return item.encode().encode("utf-8")
+    return _encode_data_only(item)
+
+
 class EventSourceResponse(StreamingResponse):
     """SSE response that streams events to the client.
 
@@ -70,6 +149,13 @@ class EventSourceResponse(StreamingResponse):
                     yield ServerSentEvent(data={"count": i}, event="update")
                     await asyncio.sleep(1)
             return EventSourceResponse(generate())
+
+    A ``: ping`` comment is sent whenever the source stays idle for
+    ``ping_interval`` seconds; pass ``ping_interval=None`` to disable it.
+
+    For high-rate streams (e.g. per-token output), ``coalesce_bytes=256`` batches
+    consecutive events into fewer writes, holding none longer than
+    ``coalesce_delay`` seconds. Off by default so every event is sent at once.
     """
 
     def __init__(
@@ -78,9 +164,13 @@ class EventSourceResponse(StreamingResponse):
         *,
         status_code: int = 200,
         headers: dict[str, str] | None = None,
-        ping_interval: float = 15,
+        ping_interval: float | None = 15,
+        coalesce_bytes: int = 0,
+        coalesce_delay: float = 0.015,
     ):
         self.ping_interval = ping_interval
+        self.coalesce_bytes = coalesce_bytes
+        self.coalesce_delay = coalesce_delay
         self._source = content
 
         sse_headers = {
@@ -100,39 +190,132 @@ class EventSourceResponse(StreamingResponse):
         )
 
     async def _wrap_with_ping(self, source: AsyncIterator):
-        """Wrap the source iterator with keep-alive pings."""
-        ping_event = ServerSentEvent(comment="ping")
-        ping_encoded = ping_event.encode()
+        """Wrap the source iterator with keep-alive pings and optional coalescing.
 
-        async def _ping_task(queue: asyncio.Queue):
-            try:
-                while True:
-                    await asyncio.sleep(self.ping_interval)
-                    await queue.put(ping_encoded)
-            except asyncio.CancelledError:
-                pass
+        A ping is sent only after the stream has been idle for ``ping_interval``
+        seconds, so busy streams carry no pings and idle ones still get them.
+        With ``coalesce_bytes`` set, encoded events are buffered and written as
+        one chunk once the buffer reaches that size or its oldest event is
+        ``coalesce_delay`` seconds old.
 
-        queue: asyncio.Queue[str | None] = asyncio.Queue()
-        ping = asyncio.create_task(_ping_task(queue))
+        The source runs in its own task, at most ``_READ_AHEAD`` frames ahead.
+        Frames that are already waiting are passed on without touching the
+        timer; only when nothing is ready does the wrapper wait, on one timer
+        that is pushed back lazily rather than re-armed per event. A timeout
+        never cancels the source mid-step.
+        """
+        ping_interval = self.ping_interval
+        if ping_interval is not None and ping_interval <= 0:
+            ping_interval = None
+        coalesce_bytes = self.coalesce_bytes
 
-        try:
+        if ping_interval is None and not coalesce_bytes:
             async for item in source:
-                # Auto-wrap non-SSE items
-                if isinstance(item, ServerSentEvent):
-                    yield item.encode()
-                elif isinstance(item, dict):
-                    yield format_sse_event(ServerSentEvent(data=item))
-                elif isinstance(item, str):
-                    yield format_sse_event(ServerSentEvent(data=item))
-                else:
-                    yield format_sse_event(ServerSentEvent(data=item))
-
-                # Drain any pending pings
-                while not queue.empty():
-                    yield queue.get_nowait()
-        finally:
-            ping.cancel()
+                yield _encode_frame(item)
+            return
+
+        loop = asyncio.get_running_loop()
+        iterator = source.__aiter__()
+        ready: deque[bytes | None] = deque()  # encoded frames; None marks the end
+        failure: list[Exception] = []
+        waiter: asyncio.Future | None = None  # consumer idle: woken by a frame or timer
+        space: asyncio.Future | None = None  # producer paused: woken when a frame is taken
+        timer: asyncio.TimerHandle | None = None
+        deadline = math.inf
+
+        def wake(timed_out: bool = False) -> None:
+            if waiter is not None and not waiter.done():
+                waiter.set_result(timed_out)
+
+        def on_timer() -> None:
+            nonlocal timer
+            timer = None
+            if loop.time() < deadline:  # pushed back since it was armed
+                timer = loop.call_at(deadline, on_timer)
+            else:
+                wake(True)
+
+        async def produce() -> None:
+            nonlocal space
             try:
-                await ping
-            except asyncio.CancelledError:
-                pass
+                async for item in iterator:
+                    ready.append(_encode_frame(item))
+                    wake()
+                    if len(ready) >= _READ_AHEAD:
+                        space = loop.create_future()
+                        await space
+            except Exception as exc:
+                failure.append(exc)
+            finally:
+                aclose = getattr(iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                ready.append(None)
+                wake()
+
+        task = loop.create_task(produce())
+        buffered: list[bytes] = []
+        buffered_size = 0
+        flush_at = 0.0
+        idle_until = loop.time() + ping_interval if ping_interval is not None else math.inf
+        try:
+            while True:
+                if not ready:
+                    deadline = flush_at if buffered else idle_until
+                    if deadline != math.inf and (timer is None or timer.when() > deadline):
+                        if timer is not None:
+                            timer.cancel()
+                        timer = loop.call_at(deadline, on_timer)
+                    waiter = loop.create_future()
+                    timed_out = await waiter
+                    waiter = None
+                    if not timed_out:
+                        continue
+                    if buffered:
+                        yield b"".join(buffered)
+                        buffered.clear()
+                        buffered_size = 0
+                    else:
+                        yield _PING
+                    if ping_interval is not None:
+                        idle_until = loop.time() + ping_interval
+                    continue
+
+                frame = ready.popleft()
+                if space is not None and not space.done():
+                    space.set_result(None)
+                if frame is None:
+                    if failure:
+                        raise failure[0]
+                    break
+
+                if coalesce_bytes:
+                    now = loop.time()
+                    if buffered and now >= flush_at:
+                        yield b"".join(buffered)
+                        buffered.clear()
+                        buffered_size = 0
+                    if not buffered:
+                        flush_at = now + self.coalesce_delay
+                    buffered.append(frame)
+                    buffered_size += len(frame)
+                    if buffered_size < coalesce_bytes:
+                        continue
+                    frame = b"".join(buffered)
+                    buffered.clear()
+                    buffered_size = 0
+                yield frame
+                if ping_interval is not None:
+                    idle_until = loop.time() + ping_interval
+
+            if buffered:
+                yield b"".join(buffered)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
@@ -5,9 +5,11 @@ Phase 3: Handler classification for fast dispatch (bypass Python enhanced wrappe
 """
 
 import dis
+import gc
 import inspect
 import json
 import os
+import re
 from typing import Any, get_origin
 
 try:
@@ -58,6 +60,16 @@ _ASYNCIO_SENSITIVE_CALLABLES = _ASYNC_LOOP_NAMES | {
     "wait_for",
 }
 
+# Headers the Zig response writer emits itself; copies from handlers or
+# middleware are dropped.
+_ZIG_OWNED_HEADERS = frozenset({"content-length", "server", "date", "connection"})
+
+
+def _sanitize_header_component(value: str) -> str:
+    # Prevent CRLF injection when extra headers are tunneled through
+    # the content_type field for the Zig response writer.
+    return value.replace("\r", "").replace("\n", "")
+
 
 def _is_asyncio_sensitive_object(obj) -> bool:
     obj_name = getattr(obj, "__name__", "")
@@ -533,8 +545,6 @@ class ZigIntegratedTurboAPI(TurboAPI):
 
     def db_get(self, path: str, *, table: str, pk: str = "id", columns: list[str] | None = None):
         """Zig-native SELECT by primary key. No Python, no GIL."""
-        import re
-
         params = re.findall(r"\{([^}]+)\}", path)
         pk_param = params[0] if params else pk
         column_str = ",".join(columns) if columns else ""
@@ -579,8 +589,6 @@ class ZigIntegratedTurboAPI(TurboAPI):
 
     def db_delete(self, path: str, *, table: str, pk: str = "id"):
         """Zig-native DELETE by primary key. No Python, no GIL."""
-        import re
-
         params = re.findall(r"\{([^}]+)\}", path)
         pk_param = params[0] if params else pk
         self._db_routes = getattr(self, "_db_routes", [])
@@ -617,8 +625,6 @@ class ZigIntegratedTurboAPI(TurboAPI):
             ''', params=["item_id", "limit"])
             def similar(): pass
         """
-        import re
-
         op = "custom_query_single" if single else "custom_query"
 
         # Auto-detect params from path if not specified
@@ -757,11 +763,6 @@ class ZigIntegratedTurboAPI(TurboAPI):
         middleware_instances = self._middleware_instances
 
         def middleware_wrapped_handler(**kwargs):
-            def _sanitize_header_component(value: str) -> str:
-                # Prevent CRLF injection when extra headers are tunneled through
-                # the content_type field for the Zig response writer.
-                return value.replace("\r", "").replace("\n", "")
-
             raw_headers = kwargs.get("headers", {})
             normalized_headers = {k.lower(): v for k, v in raw_headers.items()}
             request = Request(
@@ -823,9 +824,7 @@ class ZigIntegratedTurboAPI(TurboAPI):
             # string it can .encode() — raw dicts crash on .encode().
             raw_content = result.get("content", "")
             if isinstance(raw_content, (dict, list)):
-                import json as _json
-
-                raw_content = _json.dumps(raw_content)
+                raw_content = json.dumps(raw_content)
             response = Response(
                 content=raw_content,
                 status_code=result.get("status_code", 200),
@@ -842,17 +841,16 @@ class ZigIntegratedTurboAPI(TurboAPI):
 
             # Collect all extra headers: from the handler's Response object
             # (passed through as "extra_headers") plus any set by middleware hooks.
-            _ZIG_OWNED = frozenset({"content-length", "server", "date", "connection"})
             all_extra: dict = {}
 
             # 1. Handler-level extra headers (e.g. Set-Cookie from responses.py.Response)
             for k, v in (result.pop("extra_headers", None) or {}).items():
-                if k.lower() not in _ZIG_OWNED:
+                if k.lower() not in _ZIG_OWNED_HEADERS:
                     all_extra[k] = v
 
             # 2. Middleware after_request headers
             for k, v in response.headers.items():
-                if k.lower() not in _ZIG_OWNED:
+                if k.lower() not in _ZIG_OWNED_HEADERS:
                     existing = all_extra.get(k)
                     if existing is None:
                         all_extra[k] = v
@@ -1071,8 +1069,6 @@ class ZigIntegratedTurboAPI(TurboAPI):
 
     def _extract_path_params(self, route_path: str, actual_path: str) -> dict[str, str]:
         """Extract path parameters from actual path using route pattern."""
-        import re
-
         # Convert route path to regex
         pattern = route_path
         param_names = []
@@ -1160,6 +1156,13 @@ class ZigIntegratedTurboAPI(TurboAPI):
 
             asyncio.run(self._run_startup_handlers())
 
+        # Routes, handlers, models and startup state live for the whole process.
+        # Freeze them into the permanent generation so collections while serving
+        # only traverse per-request garbage (TURBO_DISABLE_GC_FREEZE=1 opts out).
+        if os.getenv("TURBO_DISABLE_GC_FREEZE") != "1":
+            gc.collect()
+            gc.freeze()
+
         print(f"\n{CHECK_MARK} TurboAPI Direct Zig Integration ready!")
         print(f"   Visit: http://{host}:{port}")
 
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def collect():
+    """Drain a streaming response's body iterator into a list of chunks."""
+
+    def _collect(response):
+        async def run():
+            return [chunk async for chunk in response.body_iterator()]
+
+        return asyncio.run(run())
+
+    return _collect
@@ -119,3 +119,76 @@ def test_classic_depends_still_works():
     resp = client.get("/classic")
     assert resp.status_code == 200
     assert resp.json()["db"] == {"connection": "fake_db"}
+
+
+def test_async_dependencies_reuse_the_thread_event_loop():
+    """Async dependencies run on the worker thread's loop, not a new one each time."""
+    import asyncio
+    import inspect
+
+    from turboapi.request_handler import DependencyResolver
+
+    loops = []
+    events = []
+
+    async def get_session():
+        loops.append(asyncio.get_running_loop())
+        return "session"
+
+    async def get_conn():
+        loops.append(asyncio.get_running_loop())
+        events.append("open")
+        yield "conn"
+        await asyncio.sleep(0)
+        events.append("close")
+
+    def handler(session=Depends(get_session), conn=Depends(get_conn)):
+        pass
+
+    sig = inspect.signature(handler)
+    first_ctx, second_ctx = {}, {}
+    first = DependencyResolver.resolve_dependencies(sig, first_ctx)
+    events.append(f"handler:{first['conn']}")
+    DependencyResolver.run_cleanups(first_ctx)
+    second = DependencyResolver.resolve_dependencies(sig, second_ctx)
+    DependencyResolver.run_cleanups(second_ctx)
+
+    assert first == second == {"session": "session", "conn": "conn"}
+    assert events == ["open", "handler:conn", "close", "open", "close"]
+    assert len(loops) == 4
+    assert all(loop is loops[0] for loop in loops)
+    assert not loops[0].is_closed()
+
+
+def test_async_handler_awaits_async_dependencies_on_the_worker_loop():
+    """Zig runs async handlers via run_coroutine; their dependencies share that loop."""
+    import asyncio
+
+    from turboapi.async_pool import run_coroutine
+    from turboapi.request_handler import create_enhanced_handler
+
+    events = []
+
+    async def get_session():
+        await asyncio.sleep(0)
+        return "session"
+
+    async def get_conn(session=Depends(get_session)):
+        events.append(f"open:{session}")
+        yield "conn"
+        await asyncio.sleep(0)
+        events.append("close")
+
+    async def handler(session=Depends(get_session), conn=Depends(get_conn)):
+        events.append(f"handler:{session}:{conn}")
+        return {"session": session, "conn": conn}
+
+    class Route:
+        path = "/deps"
+
+    wrapped = create_enhanced_handler(handler, Route())
+    result = run_coroutine(wrapped(headers={}, query_string="", body=b""))
+
+    assert result["status_code"] == 200
+    assert result["content"] == {"session": "session", "conn": "conn"}
+    assert events == ["open:session", "handler:session:conn", "close"]
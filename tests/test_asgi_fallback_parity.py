@@ -2,18 +2,27 @@
 
 import asyncio
 import json
+import threading
 from pathlib import Path
 from typing import Annotated
 
+import pytest
 from dhi import BaseModel
 from turboapi import Cookie, Depends, File, Form, Header, Query, TurboAPI, UploadFile
-from turboapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from turboapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    PlainTextResponse,
+    StreamingResponse,
+)
 from turboapi.staticfiles import StaticFiles
 
 
 def call_asgi(app, method="GET", path="/", *, query_string=b"", body=b"", headers=None):
     sent = []
-    received = False
+    # A list body is delivered as multiple http.request messages (more_body=True)
+    parts = list(body) if isinstance(body, list) else [body]
 
     scope = {
         "type": "http",
@@ -30,10 +39,9 @@ def call_asgi(app, method="GET", path="/", *, query_string=b"", body=b"", header
     }
 
     async def receive():
-        nonlocal received
-        if not received:
-            received = True
-            return {"type": "http.request", "body": body, "more_body": False}
+        if parts:
+            chunk = parts.pop(0)
+            return {"type": "http.request", "body": chunk, "more_body": bool(parts)}
         return {"type": "http.disconnect"}
 
     async def send(message):
@@ -110,6 +118,57 @@ def test_asgi_streaming_response_sends_chunks():
     assert body_messages[-1].get("more_body") is False
 
 
+def test_asgi_sync_handler_runs_off_event_loop_thread():
+    app = TurboAPI()
+    handler_threads = []
+
+    @app.get("/sync")
+    def sync_handler():
+        handler_threads.append(threading.get_ident())
+        return {"ok": True}
+
+    assert as_json(call_asgi(app, path="/sync")) == {"ok": True}
+    assert handler_threads and threading.get_ident() not in handler_threads
+
+
+def test_asgi_reassembles_chunked_request_body():
+    app = TurboAPI()
+
+    @app.post("/echo")
+    def echo(name: str, size: int):
+        return {"name": name, "size": size}
+
+    resp = call_asgi(
+        app,
+        method="POST",
+        path="/echo",
+        body=[b'{"name": "tur', b'bo", "si', b'ze": 3}'],
+        headers=[(b"content-type", b"application/json")],
+    )
+    assert resp["status"] == 200
+    assert json.loads(resp["body"]) == {"name": "turbo", "size": 3}
+
+
+def test_asgi_sync_stream_runs_off_event_loop_thread():
+    app = TurboAPI()
+    producer_threads = []
+
+    @app.get("/stream")
+    def stream():
+        def gen():
+            producer_threads.append(threading.get_ident())
+            yield "a"
+            producer_threads.append(threading.get_ident())
+            yield "b"
+
+        return StreamingResponse(gen(), media_type="text/plain")
+
+    resp = call_asgi(app, path="/stream")
+    assert resp["body"] == b"ab"
+    assert producer_threads
+    assert threading.get_ident() not in producer_threads
+
+
 def test_asgi_depends_json_model_query_header_cookie_and_form():
     class ItemIn(BaseModel):
         name: str
@@ -218,3 +277,256 @@ def test_asgi_file_upload_openapi_docs_redoc_and_static(tmp_path: Path):
     static_resp = call_asgi(app, path="/static/hello.txt")
     assert static_resp["status"] == 200
     assert static_resp["body"] == b"static-ok"
+
+
+def test_asgi_max_concurrency_queues_then_rejects_with_503():
+    app = TurboAPI(title="Admission", max_concurrency=1, max_queued=1)
+    running = []
+    peak = []
+    load = []
+
+    @app.get("/work")
+    async def work():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.05)
+        load.append(app.admission_stats())
+        running.pop()
+        return {"ok": True}
+
+    async def one(statuses):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/work",
+            "query_string": b"",
+            "headers": [],
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                headers = {k.lower(): v for k, v in message.get("headers", [])}
+                statuses.append((message["status"], headers))
+
+        await app(scope, receive, send)
+
+    async def run():
+        statuses = []
+        await asyncio.gather(*(one(statuses) for _ in range(3)))
+        return statuses
+
+    statuses = asyncio.run(run())
+    codes = sorted(status for status, _ in statuses)
+    assert codes == [200, 200, 503]
+    assert max(peak) == 1
+    rejected = next(headers for status, headers in statuses if status == 503)
+    assert rejected.get(b"retry-after") == b"1"
+    assert load[0] == {"active": 1, "waiting": 1, "max_concurrency": 1, "max_queued": 1}
+    assert app.admission_stats()["active"] == 0
+
+
+@pytest.mark.parametrize("options", [{"max_queued": 8}, {"queue_timeout": 1.0}])
+def test_admission_options_require_max_concurrency(options):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        TurboAPI(title="Admission", **options)
+
+
+def test_asgi_result_conversion_for_plain_and_model_like_values():
+    app = TurboAPI(title="Results")
+
+    class Legacy:
+        def dict(self):
+            return {"legacy": True}
+
+    class Payload(dict):
+        pass
+
+    @app.get("/legacy")
+    def legacy():
+        return Legacy()
+
+    @app.get("/subclass")
+    def subclass():
+        return Payload(a=1)
+
+    @app.get("/list")
+    def as_list():
+        return [1, "two"]
+
+    assert as_json(call_asgi(app, path="/legacy")) == {"legacy": True}
+    assert as_json(call_asgi(app, path="/subclass")) == {"a": 1}
+    assert as_json(call_asgi(app, path="/list")) == [1, "two"]
+
+
+def test_asgi_orjson_response_matches_json_response():
+    pytest.importorskip("orjson")
+    app = TurboAPI(title="ORJSON")
+    payload = {"name": "café", "items": [1, 2.5, None, True], 3: "int key"}
+
+    @app.get("/fast")
+    def fast():
+        return ORJSONResponse(payload, status_code=201)
+
+    resp = call_asgi(app, path="/fast")
+    assert resp["status"] == 201
+    assert header(resp, b"content-type").startswith(b"application/json")
+    assert as_json(resp) == {"name": "café", "items": [1, 2.5, None, True], "3": "int key"}
+    assert ORJSONResponse({"x": float("nan")}).body == b'{"x":null}'
+
+
+def test_enhanced_handler_passes_orjson_body_through():
+    """The Zig path sends ORJSONResponse's rendered body instead of re-encoding it."""
+    pytest.importorskip("orjson")
+    from turboapi.request_handler import create_enhanced_handler
+
+    response = ORJSONResponse({"name": "café", "items": [1, 2.5]}, status_code=201)
+
+    def handler():
+        return response
+
+    class Route:
+        path = "/fast"
+
+    result = create_enhanced_handler(handler, Route())()
+    assert result["status_code"] == 201
+    assert result["content_type"] == "application/json"
+    assert result["content"] == response.body.decode("utf-8")
+
+
+def test_asgi_docs_responses_are_cached_until_inputs_change():
+    app = TurboAPI(title="Docs Cache")
+
+    @app.get("/a")
+    def a():
+        return {}
+
+    first = call_asgi(app, path="/openapi.json")
+    second = call_asgi(app, path="/openapi.json")
+    assert first["body"] == second["body"]
+    assert app._docs_response("/openapi.json") is app._docs_response("/openapi.json")
+
+    @app.get("/b")
+    def b():
+        return {}
+
+    app._openapi_schema = None  # schema regenerated -> cached JSON refreshed
+    assert "/b" in as_json(call_asgi(app, path="/openapi.json"))["paths"]
+
+    assert b"Docs Cache" in call_asgi(app, path="/docs")["body"]
+    app.title = "Renamed"
+    assert b"Renamed" in call_asgi(app, path="/docs")["body"]
+
+
+def test_asgi_handler_and_dependency_signatures_are_inspected_once(monkeypatch):
+    import inspect
+
+    from turboapi import main_app
+
+    calls = []
+    real_signature = inspect.signature
+
+    def counting_signature(func, *args, **kwargs):
+        calls.append(func)
+        return real_signature(func, *args, **kwargs)
+
+    monkeypatch.setattr(main_app.inspect, "signature", counting_signature)
+    app = TurboAPI(title="Signatures")
+
+    def token(x_token: str = Header(default="none")):
+        return x_token
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int, token: Annotated[str, Depends(token)]):
+        return {"item_id": item_id, "token": token}
+
+    calls.clear()
+    for i in range(3):
+        resp = call_asgi(app, path=f"/items/{i}", headers=[(b"x-token", b"t")])
+        assert as_json(resp) == {"item_id": i, "token": "t"}
+    assert calls.count(item) == 1
+    assert calls.count(token) == 1
+
+
+def test_signature_cache_does_not_keep_callables_alive():
+    import gc
+    import weakref
+
+    from turboapi import main_app
+
+    def handler(a: int):
+        return a
+
+    assert str(main_app._signature(handler)) == "(a: int)"
+    ref = weakref.ref(handler)
+    del handler
+    gc.collect()
+    assert ref() is None
+
+
+def test_asgi_shared_dependency_runs_once_per_request_unless_uncached():
+    app = TurboAPI(title="Dependency cache")
+    calls = []
+
+    def current_user(session: str = Cookie(default="anon")):
+        calls.append(session)
+        return session
+
+    def audit(user: Annotated[str, Depends(current_user)]):
+        return f"audit:{user}"
+
+    @app.get("/cached")
+    def cached(user: Annotated[str, Depends(current_user)], log: Annotated[str, Depends(audit)]):
+        return {"user": user, "log": log}
+
+    @app.get("/uncached")
+    def uncached(
+        a: Annotated[str, Depends(current_user, use_cache=False)],
+        b: Annotated[str, Depends(current_user, use_cache=False)],
+    ):
+        return {"a": a, "b": b}
+
+    resp = call_asgi(app, path="/cached", headers=[(b"cookie", b"session=s1")])
+    assert as_json(resp) == {"user": "s1", "log": "audit:s1"}
+    assert calls == ["s1"]
+
+    calls.clear()
+    assert as_json(call_asgi(app, path="/uncached")) == {"a": "anon", "b": "anon"}
+    assert calls == ["anon", "anon"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_asgi_json_body_parses_with_and_without_orjson(monkeypatch, use_orjson):
+    from turboapi import encoders
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(encoders, "orjson", None)
+    app = TurboAPI(title="JSON body")
+
+    @app.post("/echo")
+    def echo(name: str, score: float):
+        return {"name": name, "score": repr(score)}
+
+    def post(body: bytes):
+        headers = [(b"content-type", b"application/json")]
+        return as_json(call_asgi(app, "POST", "/echo", body=body, headers=headers))
+
+    assert post('{"name": "café", "score": 1.5}'.encode()) == {"name": "café", "score": "1.5"}
+    assert post(b'{"name": "x", "score": NaN}') == {"name": "x", "score": "nan"}
+
+
+def test_asgi_json_body_keeps_integers_beyond_64_bits():
+    app = TurboAPI(title="JSON big int")
+
+    @app.post("/echo")
+    def echo(value: int):
+        return {"value": str(value)}
+
+    headers = [(b"content-type", b"application/json")]
+    body = b'{"value": 18446744073709551617}'
+    response = call_asgi(app, "POST", "/echo", body=body, headers=headers)
+    assert as_json(response) == {"value": "18446744073709551617"}
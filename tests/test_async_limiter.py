@@ -0,0 +1,117 @@
+"""Tests for the per-event-loop AsyncLimiter."""
+
+import asyncio
+
+import pytest
+from turboapi.async_limiter import AsyncLimiter
+from turboapi.exceptions import HTTPException
+
+
+def test_limiter_caps_concurrency():
+    async def main():
+        limiter = AsyncLimiter(max_concurrent=2)
+        running = peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        results = await asyncio.gather(*(limiter(work()) for _ in range(6)))
+        return results, peak, limiter.active_tasks, limiter.available_slots
+
+    results, peak, active, available = asyncio.run(main())
+    assert results == ["ok"] * 6
+    assert peak == 2
+    assert active == 0
+    assert available == 2
+
+
+def test_limiter_rejects_when_wait_queue_full():
+    async def main():
+        limiter = AsyncLimiter(max_concurrent=1, max_waiting=1)
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "ok"
+
+        holder = asyncio.create_task(limiter(work()))
+        waiter = asyncio.create_task(limiter(work()))
+        await asyncio.sleep(0)
+        assert limiter.waiting_tasks == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(work())
+
+        gate.set()
+        return exc_info.value, await holder, await waiter
+
+    exc, first, second = asyncio.run(main())
+    assert exc.status_code == 503
+    assert exc.headers == {"Retry-After": "1"}
+    assert (first, second) == ("ok", "ok")
+
+
+def test_limiter_unbounded_wait_by_default():
+    async def main():
+        limiter = AsyncLimiter(max_concurrent=1)
+
+        async def work(i):
+            await asyncio.sleep(0)
+            return i
+
+        return await asyncio.gather(*(limiter(work(i)) for i in range(50)))
+
+    assert asyncio.run(main()) == list(range(50))
+
+
+def test_limiter_rejects_after_max_wait():
+    async def main():
+        limiter = AsyncLimiter(max_concurrent=1, max_wait=0.02)
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "ok"
+
+        holder = asyncio.create_task(limiter(work()))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(work())
+        waiting_after_timeout = limiter.waiting_tasks
+
+        gate.set()
+        return exc_info.value, waiting_after_timeout, await holder, await limiter(work())
+
+    exc, waiting, first, later = asyncio.run(main())
+    assert exc.status_code == 503
+    assert waiting == 0
+    assert (first, later) == ("ok", "ok")
+
+
+def test_limiter_closes_coroutine_cancelled_while_waiting():
+    async def main():
+        limiter = AsyncLimiter(max_concurrent=1)
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "ok"
+
+        holder = asyncio.create_task(limiter(work()))
+        queued = work()
+        waiter = asyncio.create_task(limiter(queued))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        gate.set()
+        return queued, await holder
+
+    queued, first = asyncio.run(main())
+    assert queued.cr_frame is None  # closed, so no "never awaited" warning
+    assert first == "ok"
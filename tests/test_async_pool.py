@@ -0,0 +1,89 @@
+"""Tests for the per-thread event loop pool."""
+
+import asyncio
+import sys
+import threading
+
+from turboapi import async_pool
+from turboapi.async_pool import EventLoopPool, run_coroutine
+
+
+def test_each_thread_gets_its_own_reused_loop():
+    results = {}
+    barrier = threading.Barrier(4)
+
+    def worker(i):
+        barrier.wait()
+        first = EventLoopPool.get_loop_for_thread()
+        second = EventLoopPool.get_loop_for_thread()
+
+        async def answer():
+            return i
+
+        results[i] = (first, second, run_coroutine(answer()))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    loops = [first for first, _, _ in results.values()]
+    assert all(first is second for first, second, _ in results.values())
+    assert len({id(loop) for loop in loops}) == 4
+    assert sorted(value for _, _, value in results.values()) == [0, 1, 2, 3]
+    assert EventLoopPool.stats()["total_loops"] >= 4
+
+    for loop in loops:
+        loop.close()
+
+
+def test_worker_loops_use_uvloop_when_available(monkeypatch):
+    created = []
+
+    class FakeUvloop:
+        @staticmethod
+        def new_event_loop():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+    monkeypatch.setitem(sys.modules, "uvloop", FakeUvloop)
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+
+    def loop_in_new_thread():
+        box = []
+        t = threading.Thread(target=lambda: box.append(EventLoopPool.get_loop_for_thread()))
+        t.start()
+        t.join()
+        box[0].close()
+        return box[0]
+
+    assert loop_in_new_thread() is created[-1]
+
+    monkeypatch.setenv("TURBO_DISABLE_UVLOOP", "1")
+    assert loop_in_new_thread() not in created
+
+
+def test_free_threaded_builds_use_uvloop_only_on_request(monkeypatch):
+    created = []
+
+    class FakeUvloop:
+        @staticmethod
+        def new_event_loop():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+    monkeypatch.setitem(sys.modules, "uvloop", FakeUvloop)
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    monkeypatch.delenv("TURBO_DISABLE_UVLOOP", raising=False)
+
+    loop = async_pool._new_event_loop()
+    loop.close()
+    assert loop not in created
+
+    monkeypatch.setenv("TURBO_UVLOOP", "1")
+    loop = async_pool._new_event_loop()
+    loop.close()
+    assert loop is created[-1]
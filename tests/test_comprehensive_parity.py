@@ -27,6 +27,8 @@ from turboapi.middleware import (
     HTTPSRedirectMiddleware,
     TrustedHostMiddleware,
 )
+from turboapi.models import Request
+from turboapi.models import Response as MiddlewareResponse
 from turboapi.responses import (
     HTMLResponse,
     JSONResponse,
@@ -333,6 +335,32 @@ class TestMiddleware:
         trusted = TrustedHostMiddleware(allowed_hosts=["example.com", "*.example.com"])
         assert "example.com" in trusted.allowed_hosts
 
+    def test_trusted_host_matches_exact_and_wildcard_hosts(self):
+        """Exact and wildcard entries both admit hosts; anything else is rejected."""
+        trusted = TrustedHostMiddleware(allowed_hosts=["example.com", "*.example.org"])
+        for host in ("example.com", "example.com:8000", "api.example.org"):
+            trusted.before_request(Request(method="GET", path="/", headers={"host": host}))
+        for host in ("evil.com", "example.community", "example.org"):
+            with pytest.raises(Exception, match="Invalid host"):
+                trusted.before_request(Request(method="GET", path="/", headers={"host": host}))
+
+        anything = TrustedHostMiddleware()
+        anything.before_request(Request(method="GET", path="/", headers={"host": "whatever"}))
+
+    def test_cors_allow_origin_header(self):
+        """Only listed origins are echoed back; wildcard answers with '*'."""
+        cors = CORSMiddleware(allow_origins=["https://a.example", "https://b.example"])
+
+        def allow_origin(mw, origin):
+            req = Request(method="GET", path="/", headers={"origin": origin})
+            return mw.after_request(req, MiddlewareResponse(content="")).headers.get(
+                "Access-Control-Allow-Origin"
+            )
+
+        assert allow_origin(cors, "https://b.example") == "https://b.example"
+        assert allow_origin(cors, "https://c.example") is None
+        assert allow_origin(CORSMiddleware(), "https://c.example") == "*"
+
     def test_https_redirect_middleware(self):
         """HTTPSRedirectMiddleware should be available like FastAPI."""
         https_redirect = HTTPSRedirectMiddleware()
@@ -276,6 +276,18 @@ class TestResponses:
         assert "session=abc123" in resp.headers["set-cookie"]
         assert "HttpOnly" in resp.headers["set-cookie"]
 
+    def test_response_set_cookie_attribute_order(self):
+        resp = Response(content="Hello")
+        resp.set_cookie(
+            "s", "v", max_age=60, expires=1, domain="example.com", secure=True, httponly=True
+        )
+        resp.delete_cookie("old")
+        assert resp.headers["set-cookie"] == [
+            "s=v; Path=/; Max-Age=60; Expires=1; Domain=example.com; Secure; HttpOnly; "
+            "SameSite=lax",
+            "old=; Path=/; Max-Age=0; SameSite=lax",
+        ]
+
     def test_response_handler_returns_response(self):
         app = TurboAPI(title="ResponseTest")
 
@@ -1102,6 +1114,24 @@ class TestFastAPIExportParity:
         assert result["name"] == "Alice"
         assert result["age"] == 30
 
+    def test_jsonable_encoder_pydantic_model_without_eager_import(self, monkeypatch):
+        """Pydantic models are encoded via the already-loaded pydantic module."""
+        import sys
+        import types
+
+        class FakeBaseModel:
+            def model_dump(self, **kwargs):
+                return {"name": "Bob", "email": None}
+
+        fake = types.ModuleType("pydantic")
+        fake.BaseModel = FakeBaseModel
+        monkeypatch.setitem(sys.modules, "pydantic", fake)
+
+        assert jsonable_encoder(FakeBaseModel()) == {"name": "Bob", "email": None}
+
+        monkeypatch.delitem(sys.modules, "pydantic")
+        assert jsonable_encoder({"n": 1}) == {"n": 1}
+
     def test_jsonable_encoder_exclude_none(self):
         """Test jsonable_encoder exclude_none parameter."""
         data = {"name": "Alice", "email": None, "age": 30}
@@ -57,6 +57,16 @@ class TestResponseSerialization:
         assert status_code == 201
         assert content == {"key": "value"}
 
+    def test_json_response_normalize_skips_reparse(self):
+        """JSONResponse content is handed back as-is unless the body was replaced."""
+        payload = {"items": [1, 2], "name": "café"}
+        resp = JSONResponse(content=payload)
+        assert ResponseHandler.normalize_response(resp)[0] is payload
+
+        resp = JSONResponse(content=payload)
+        resp.body = b'{"replaced": true}'
+        assert ResponseHandler.normalize_response(resp)[0] == {"replaced": True}
+
     def test_html_response_normalize(self):
         """Test HTMLResponse is properly normalized."""
         resp = HTMLResponse(content="<h1>Hello</h1>")
@@ -376,6 +386,43 @@ class TestJSONParsing:
         assert "items" in result
         assert result["items"] == [1, 2, 3, "four", {"five": 5}]
 
+    def test_json_body_accepts_nan_literal(self):
+        """NaN still parses when orjson (which rejects it) is the primary decoder."""
+
+        def handler(data: dict):
+            pass
+
+        sig = inspect.signature(handler)
+        result = RequestBodyParser.parse_json_body(b'{"x": NaN}', sig)
+        assert result["data"]["x"] != result["data"]["x"]
+
+    def test_json_body_keeps_integers_beyond_64_bits(self):
+        """Integers orjson would turn into floats are decoded exactly."""
+
+        def handler(data: dict):
+            pass
+
+        sig = inspect.signature(handler)
+        body = b'{"big": 18446744073709551617, "neg": -9223372036854775809, "small": 1}'
+        result = RequestBodyParser.parse_json_body(body, sig)
+        assert result["data"] == {
+            "big": 18446744073709551617,
+            "neg": -9223372036854775809,
+            "small": 1,
+        }
+
+    def test_invalid_json_and_utf8_raise_parsing_error(self):
+        """Decoder failures surface as RequestParsingError regardless of backend."""
+        from turboapi.request_handler import RequestParsingError
+
+        def handler(data: dict):
+            pass
+
+        sig = inspect.signature(handler)
+        for body in (b'{"a": ', b'{"a": "\xff"}'):
+            with pytest.raises(RequestParsingError):
+                RequestBodyParser.parse_json_body(body, sig)
+
 
 # ============================================================================
 # Integration tests (require server)
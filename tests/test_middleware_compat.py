@@ -301,3 +301,26 @@ def test_custom_logging_style_middleware_runtime_hooks():
     assert r.headers.get("X-Custom-Logged") == "yes"
     assert r.json() == {"logged": True}
     assert CaptureLoggingMiddleware.calls == [("GET", "/logged", 200)]
+
+
+def test_logging_middleware_uses_lazy_logger(caplog):
+    """LoggingMiddleware writes through the turboapi logger, not print()."""
+    from types import SimpleNamespace
+
+    middleware = LoggingMiddleware()
+    request = SimpleNamespace(method="GET", path="/items")
+    response = SimpleNamespace(status_code=201)
+
+    with caplog.at_level("INFO", logger="turboapi"):
+        middleware.before_request(request)
+        assert middleware.after_request(request, response) is response
+
+    messages = [r.getMessage() for r in caplog.records if r.name == "turboapi"]
+    assert messages[0] == "[REQUEST] GET /items"
+    assert messages[1].startswith("[RESPONSE] GET /items -> 201 (")
+
+    caplog.clear()
+    with caplog.at_level("WARNING", logger="turboapi"):
+        middleware.before_request(request)
+        middleware.after_request(request, response)
+    assert not [r for r in caplog.records if r.name == "turboapi"]
@@ -97,3 +97,31 @@ def test_scalar_benchmark_shape_has_no_compatibility_wrapper():
     assert type(seen[0]) is Item
     assert dumped["name"] == "Widget"
     assert dumped["price"] == 9.99
+
+
+def test_format_response_dumps_nested_models_and_normalizes_leaves():
+    from turboapi.request_handler import ResponseHandler
+
+    class Item(BaseModel):
+        name: str
+
+    content = {
+        "item": Item(name="a"),
+        "items": (Item(name="b"),),
+        "raw": b"text",
+        "blob": b"\xff",
+        "n": [1, 2.5, True, None],
+        "other": object,
+    }
+    result = ResponseHandler.format_response(content, 200)
+
+    assert result["content"] == {
+        "item": {"name": "a"},
+        "items": [{"name": "b"}],
+        "raw": "text",
+        "blob": "/w==",
+        "n": [1, 2.5, True, None],
+        "other": str(object),
+    }
+    assert result["status_code"] == 200
+    assert result["content_type"] == "application/json"
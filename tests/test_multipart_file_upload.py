@@ -191,3 +191,48 @@ class TestUrlencodedParsing:
         resp = client.post("/form", data={"email": "test@example.com"})
         assert resp.status_code == 200
         assert resp.json()["email"] == "test@example.com"
+
+
+class TestEnhancedHandlerFormBinding:
+    """Zig hands form/file parts to the enhanced handler as form_fields/file_fields."""
+
+    @staticmethod
+    def _route():
+        class Route:
+            path = "/upload"
+
+        return Route()
+
+    def test_sync_handler_binds_form_file_and_upload(self):
+        from turboapi.request_handler import create_enhanced_handler
+
+        def handler(
+            name: str = Form(),
+            note: str = Form(default="none"),
+            doc: UploadFile = File(alias="document"),
+            extra: UploadFile = None,
+        ):
+            return {"name": name, "note": note, "doc": doc.file.read().decode(), "extra": extra}
+
+        wrapped = create_enhanced_handler(handler, self._route())
+        result = wrapped(
+            body=b"",
+            form_fields={"name": "alice"},
+            file_fields=[{"name": "document", "filename": "a.txt", "body": b"hi"}],
+        )
+        assert result["status_code"] == 200
+        assert result["content"] == {"name": "alice", "note": "none", "doc": "hi", "extra": None}
+
+    def test_async_handler_binds_upload_annotation(self):
+        import asyncio
+
+        from turboapi.request_handler import create_enhanced_handler
+
+        async def handler(upload: UploadFile):
+            return {"filename": upload.filename, "size": upload.size}
+
+        wrapped = create_enhanced_handler(handler, self._route())
+        result = asyncio.run(
+            wrapped(body=b"", file_fields=[{"name": "upload", "filename": "b.bin", "body": b"xyz"}])
+        )
+        assert result["content"] == {"filename": "b.bin", "size": 3}
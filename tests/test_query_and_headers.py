@@ -240,6 +240,33 @@ def test_combined_query_and_headers():
     print("\n✅ COMBINED TEST PASSED!")
 
 
+def test_header_parser_case_insensitive_lookup():
+    """HeaderParser resolves Header() markers and bare params without a server."""
+    import inspect
+
+    from turboapi import Header
+    from turboapi.request_handler import HeaderParser
+
+    def handler(
+        user_agent: str = Header(),
+        token: str = Header(alias="X-Token"),
+        missing: str = Header(default="fallback"),
+        x_request_id: str = "",
+    ):
+        pass
+
+    parsed = HeaderParser.parse_headers(
+        {"User-Agent": "first", "user-agent": "second", "x-token": "t", "X-Request-Id": "r"},
+        inspect.signature(handler),
+    )
+    assert parsed == {
+        "user_agent": "first",
+        "token": "t",
+        "missing": "fallback",
+        "x_request_id": "r",
+    }
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 70)
@@ -4,6 +4,7 @@ Each test validates a specific bug fix from the community security audit.
 """
 
 import threading
+from types import SimpleNamespace
 
 import pytest
 
@@ -79,6 +80,49 @@ def test_rate_limiter_prefers_x_real_ip():
     rl.before_request(req3)  # should not raise
 
 
+def test_rate_limiter_forgets_idle_clients(monkeypatch):
+    """Clients idle for a full window are swept so the table stays bounded."""
+    from turboapi.middleware import RateLimitMiddleware, core
+    from turboapi.models import Request
+
+    clock = [1000.0]
+    monkeypatch.setattr(core, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    rl = RateLimitMiddleware(requests_per_minute=5)
+
+    for i in range(50):
+        req = Request(method="GET", path="/")
+        req.client_addr = f"10.0.0.{i}"
+        rl.before_request(req)
+    assert len(rl.requests) == 50
+
+    clock[0] += 61
+    req = Request(method="GET", path="/")
+    req.client_addr = "10.0.0.200"
+    rl.before_request(req)
+    assert list(rl.requests) == ["10.0.0.200"]
+
+
+def test_rate_limiter_window_slides(monkeypatch):
+    from turboapi.middleware import RateLimitMiddleware, core
+    from turboapi.models import Request
+
+    clock = [500.0]
+    monkeypatch.setattr(core, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    rl = RateLimitMiddleware(requests_per_minute=2)
+    req = Request(method="GET", path="/")
+    req.client_addr = "10.0.0.1"
+
+    rl.before_request(req)
+    clock[0] += 30
+    rl.before_request(req)
+    with pytest.raises(Exception, match="Rate limit"):
+        rl.before_request(req)
+
+    clock[0] += 30  # first request leaves the window
+    rl.before_request(req)
+    assert len(rl.requests["10.0.0.1"]) == 2
+
+
 # ── Bug #12: CORS wildcard + credentials ────────────────────────────────────
 
 
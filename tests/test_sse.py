@@ -0,0 +1,169 @@
+"""Tests for Server-Sent Events encoding and EventSourceResponse streaming."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from turboapi import sse
+from turboapi.sse import EventSourceResponse, ServerSentEvent, format_sse_event
+
+
+def test_format_event_with_all_fields():
+    evt = ServerSentEvent(data="hello", event="update", id=7, retry=1000, comment="c")
+    assert format_sse_event(evt) == ": c\nevent: update\nid: 7\nretry: 1000\ndata: hello\n\n"
+
+
+def test_events_use_slots():
+    evt = ServerSentEvent(data="x")
+    assert not hasattr(evt, "__dict__")
+    with pytest.raises(AttributeError):
+        evt.unknown = 1
+
+
+def test_multiline_string_data_splits_into_data_lines():
+    assert format_sse_event(ServerSentEvent(data="a\nb")) == "data: a\ndata: b\n\n"
+
+
+def test_dict_data_is_compact_json():
+    encoded = format_sse_event(ServerSentEvent(data={"count": 1, "name": "café"}))
+    assert encoded == 'data: {"count":1,"name":"café"}\n\n'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_payload_matches_with_and_without_orjson(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(sse, "orjson", None)
+
+    payload = {"items": [1, 2.5, None, True], "text": "ü"}
+    encoded = format_sse_event(ServerSentEvent(data=payload))
+    assert encoded.startswith("data: ")
+    assert json.loads(encoded[len("data: ") :]) == payload
+    assert encoded == 'data: {"items":[1,2.5,null,true],"text":"ü"}\n\n'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_non_finite_floats_render_as_null_with_and_without_orjson(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(sse, "orjson", None)
+
+    payload = {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "ok": 1.5}
+    expected = 'data: {"nan":null,"inf":[null,null],"ok":1.5}\n\n'
+    assert format_sse_event(ServerSentEvent(data=payload)) == expected
+    assert sse._encode_data_only(payload) == expected.encode()
+
+
+def test_non_string_keys_fall_back_to_stdlib():
+    # orjson refuses int keys without OPT_NON_STR_KEYS; the stdlib coerces them.
+    assert format_sse_event(ServerSentEvent(data={1: "a"})) == 'data: {"1":"a"}\n\n'
+
+
+def test_line_separator_in_json_stays_on_one_data_line():
+    encoded = format_sse_event(ServerSentEvent(data={"t": "a\u2028b"}))
+    assert encoded.count("data: ") == 1
+
+
+@pytest.mark.parametrize("item", ["hello", "a\nb", "", {"n": 1}, [1, 2], 3, None])
+def test_bare_items_encode_like_wrapped_events(item):
+    expected = format_sse_event(ServerSentEvent(data=item)).encode()
+    assert sse._encode_data_only(item) == expected
+    assert sse._encode_frame(item) == expected
+    assert sse._encode_frame(ServerSentEvent(data=item)) == expected
+
+
+def test_idle_source_gets_pings_before_data(collect):
+    async def slow():
+        await asyncio.sleep(0.2)
+        yield {"n": 1}
+
+    chunks = collect(EventSourceResponse(slow(), ping_interval=0.03))
+    assert chunks[-1] == b'data: {"n":1}\n\n'
+    assert len(chunks) >= 3
+    assert set(chunks[:-1]) == {b": ping\n\n"}
+
+
+def test_busy_source_gets_no_pings(collect):
+    async def fast():
+        for i in range(3):
+            yield ServerSentEvent(data=str(i), event="tick")
+
+    chunks = collect(EventSourceResponse(fast(), ping_interval=10))
+    assert chunks == [f"event: tick\ndata: {i}\n\n".encode() for i in range(3)]
+
+
+def test_default_ping_interval_streams_many_events_in_order(collect):
+    async def burst():
+        for i in range(50_000):
+            yield i
+            if i % 100 == 0:
+                await asyncio.sleep(0)
+
+    response = EventSourceResponse(burst())
+    assert response.ping_interval == 15
+    start = time.perf_counter()
+    chunks = collect(response)
+    elapsed = time.perf_counter() - start
+    assert chunks == [f"data: {i}\n\n".encode() for i in range(50_000)]
+    # Pings are armed lazily, not raced against every event.
+    assert elapsed < 1.0
+
+
+def test_source_error_propagates_with_pings_enabled(collect):
+    async def broken():
+        yield "a"
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        collect(EventSourceResponse(broken(), ping_interval=10))
+
+
+def test_pings_disabled_and_source_closed_on_early_exit():
+    closed = []
+
+    async def source():
+        try:
+            yield "a"
+            await asyncio.sleep(10)
+            yield "b"
+        finally:
+            closed.append(True)
+
+    async def run(ping_interval):
+        body = EventSourceResponse(source(), ping_interval=ping_interval).body_iterator()
+        first = await body.__anext__()
+        await asyncio.sleep(0.05)
+        await body.aclose()
+        return first
+
+    assert asyncio.run(run(None)) == b"data: a\n\n"
+    assert asyncio.run(run(0.01)) == b"data: a\n\n"
+    assert closed == [True, True]
+
+
+def test_coalescing_batches_fast_events_by_size(collect):
+    async def fast():
+        for i in range(6):
+            yield {"i": i}
+
+    frames = [f'data: {{"i":{i}}}\n\n'.encode() for i in range(6)]
+
+    chunks = collect(EventSourceResponse(fast(), coalesce_bytes=1000))
+    assert chunks == [b"".join(frames)]
+
+    chunks = collect(EventSourceResponse(fast(), ping_interval=None, coalesce_bytes=30))
+    assert b"".join(chunks) == b"".join(frames)
+    assert chunks == [frames[0] + frames[1], frames[2] + frames[3], frames[4] + frames[5]]
+
+
+def test_coalescing_flushes_after_delay(collect):
+    async def bursty():
+        yield "a"
+        await asyncio.sleep(0.2)
+        yield "b"
+
+    chunks = collect(EventSourceResponse(bursty(), coalesce_bytes=1000, coalesce_delay=0.01))
+    assert chunks == [b"data: a\n\n", b"data: b\n\n"]
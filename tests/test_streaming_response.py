@@ -0,0 +1,190 @@
+"""Tests for StreamingResponse iteration over sync and async sources."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from turboapi import responses
+from turboapi.responses import StreamingResponse
+
+
+def test_async_source_chunks_are_encoded(collect):
+    async def gen():
+        yield "a"
+        yield b"b"
+
+    assert collect(StreamingResponse(gen())) == [b"a", b"b"]
+
+
+def test_sync_source_runs_in_producer_thread(collect):
+    seen = []
+
+    def gen():
+        for part in ("x", "y", b"z"):
+            seen.append(threading.current_thread().name)
+            yield part
+
+    assert collect(StreamingResponse(gen())) == [b"x", b"y", b"z"]
+    assert len(seen) == 3
+    assert all(name.startswith("turboapi-stream") for name in seen)
+
+
+def test_sync_source_error_propagates_to_consumer(collect):
+    def gen():
+        yield "ok"
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        collect(StreamingResponse(gen()))
+
+
+def test_sync_producer_is_bounded_and_closed_on_early_exit(monkeypatch):
+    monkeypatch.setattr(responses, "_SYNC_STREAM_BUFFER", 4)
+    produced = []
+    closed = threading.Event()
+
+    def gen():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield str(i)
+        finally:
+            closed.set()
+
+    async def run():
+        body = StreamingResponse(gen()).body_iterator()
+        first = await body.__anext__()
+        await asyncio.sleep(0.1)  # give the producer time to fill the buffer
+        ahead = len(produced)
+        await body.aclose()
+        return first, ahead
+
+    first, ahead = asyncio.run(run())
+    assert first == b"0"
+    # One chunk consumed, a full buffer queued, one chunk parked in the producer
+    assert ahead <= 1 + 4 + 1
+    assert closed.wait(2)
+
+
+def test_slow_sync_source_does_not_block_loop():
+    def gen():
+        time.sleep(0.2)
+        yield "done"
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        chunks = [c async for c in StreamingResponse(gen()).body_iterator()]
+        task.cancel()
+        return chunks, ticks
+
+    chunks, ticks = asyncio.run(run())
+    assert chunks == [b"done"]
+    assert ticks >= 5
+
+
+def test_sync_stream_producers_reuse_pooled_threads(collect):
+    names = set()
+
+    def gen():
+        names.add(threading.current_thread().name)
+        yield "x"
+
+    for _ in range(5):
+        assert collect(StreamingResponse(gen())) == [b"x"]
+    assert responses._get_stream_executor() is responses._get_stream_executor()
+    assert len(names) < 5
+
+
+def test_async_prefetch_overlaps_source_with_consumer():
+    async def gen():
+        for i in range(4):
+            await asyncio.sleep(0.05)
+            yield str(i)
+
+    async def run(prefetch):
+        start = time.perf_counter()
+        chunks = []
+        async for chunk in StreamingResponse(gen(), prefetch=prefetch).body_iterator():
+            chunks.append(chunk)
+            await asyncio.sleep(0.05)  # slow client
+        return chunks, time.perf_counter() - start
+
+    inline, inline_time = asyncio.run(run(0))
+    overlapped, overlapped_time = asyncio.run(run(2))
+    assert inline == overlapped == [b"0", b"1", b"2", b"3"]
+    assert overlapped_time < inline_time - 0.1
+
+
+def test_async_prefetch_propagates_errors_and_closes_source(collect):
+    closed = []
+
+    async def failing():
+        yield "ok"
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        collect(StreamingResponse(failing(), prefetch=2))
+
+    async def endless():
+        try:
+            i = 0
+            while True:
+                yield str(i)
+                i += 1
+        finally:
+            closed.append(True)
+
+    async def run():
+        body = StreamingResponse(endless(), prefetch=2).body_iterator()
+        first = await body.__anext__()
+        await body.aclose()
+        return first
+
+    assert asyncio.run(run()) == b"0"
+    assert closed == [True]
+
+
+def test_stalled_clients_do_not_hold_stream_workers(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="turboapi-stream")
+    monkeypatch.setattr(responses, "_stream_executor", executor)
+
+    def endless():
+        i = 0
+        while True:
+            i += 1
+            yield str(i)
+
+    async def drain(body):
+        return [chunk async for chunk in body]
+
+    async def run():
+        stalled = [StreamingResponse(endless()).body_iterator() for _ in range(2)]
+        for body in stalled:
+            assert await body.__anext__() == b"1"
+        await asyncio.sleep(0.05)  # both producers fill their buffers; clients stall
+
+        def short():
+            yield "a"
+            yield "b"
+
+        body = StreamingResponse(short()).body_iterator()
+        chunks = await asyncio.wait_for(drain(body), timeout=2)
+        for body in stalled:
+            await body.aclose()
+        return chunks
+
+    try:
+        assert asyncio.run(run()) == [b"a", b"b"]
+    finally:
+        executor.shutdown(wait=True)